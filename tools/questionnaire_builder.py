@@ -1,29 +1,33 @@
 #!/usr/bin/env python3
 import json
+import os
 import re
+from contextlib import contextmanager
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 
-from PySide6.QtCore import Qt, QSize, Signal, QEvent
+from PySide6.QtCore import Qt, QSize, Signal, QEvent, QTimer, QAbstractListModel, QModelIndex
 from PySide6.QtGui import QAction, QFont, QColor, QPainter, QUndoCommand, QUndoStack, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QListWidget, QListWidgetItem, QTextEdit, QComboBox, QSpinBox,
+    QListView, QAbstractItemView, QTextEdit, QComboBox, QSpinBox,
     QFileDialog, QMessageBox, QFormLayout, QDialog, QDialogButtonBox,
     QLabel, QToolBar, QStyle, QStyledItemDelegate, QCheckBox, QGroupBox, QLineEdit, QDoubleSpinBox, QAbstractSpinBox
 )
 
-from tools.themes import TYPE_COLOR_THEMES
-from tools.stylesheets import *
+from tools.themes import qcolors
+from tools.stylesheets import STYLESHEETS
 
 # ---- Theme registry (single source of truth) ----
 THEME_REGISTRY = {
-    "neon": {"label": "Neon", "stylesheet": neon_stylesheet, "app_font": ("Segoe UI", 11)},
-    "retro_terminal": {"label": "Retro Terminal", "stylesheet": retro_terminal_stylesheet, "app_font": ("Segoe UI", 11)},
-    "clinical": {"label": "Clinical", "stylesheet": clinical_stylesheet, "app_font": ("Segoe UI", 11)},
-    "oled_dark": {"label": "Oled Dark", "stylesheet": oled_dark_stylesheet, "app_font": ("Segoe UI", 11)},
-    "sunset_synth": {"label": "Sunset Synth", "stylesheet": sunset_synth_stylesheet, "app_font": ("Segoe UI", 11)},
-    "forest_mist": {"label": "Forest Mist", "stylesheet": forest_mist_stylesheet, "app_font": ("Segoe UI", 11)},
-    "signal_contrast": {"label": "Signal Contrast", "stylesheet": signal_contrast_stylesheet, "app_font": ("Segoe UI", 11)},
+    "neon": {"label": "Neon", "stylesheet": STYLESHEETS["neon"], "app_font": ("Segoe UI", 11)},
+    "retro_terminal": {"label": "Retro Terminal", "stylesheet": STYLESHEETS["retro_terminal"], "app_font": ("Segoe UI", 11)},
+    "clinical": {"label": "Clinical", "stylesheet": STYLESHEETS["clinical"], "app_font": ("Segoe UI", 11)},
+    "oled_dark": {"label": "Oled Dark", "stylesheet": STYLESHEETS["oled_dark"], "app_font": ("Segoe UI", 11)},
+    "sunset_synth": {"label": "Sunset Synth", "stylesheet": STYLESHEETS["sunset_synth"], "app_font": ("Segoe UI", 11)},
+    "forest_mist": {"label": "Forest Mist", "stylesheet": STYLESHEETS["forest_mist"], "app_font": ("Segoe UI", 11)},
+    "signal_contrast": {"label": "Signal Contrast", "stylesheet": STYLESHEETS["signal_contrast"], "app_font": ("Segoe UI", 11)},
 }
 
 QUESTION_TYPES = ["info", "yesno", "mcq", "likert", "textgrid", "sp_yesno", "sp_mcq", "sp_likert"]
@@ -43,22 +47,72 @@ DEFAULT_DENSE_ROWS = 3
 DEFAULT_DENSE_COLUMNS = 3
 DEFAULT_KDE_CONFIDENCE = 0.5
 
+TRUTHY_STRINGS = frozenset({"true", "1", "yes", "on"})
+
+SPIN_DEBOUNCE_MS = 100      # ms, coalesces key-repeat on the dwell/blink spins
+LIST_BATCH_SIZE = 50        # rows laid out per event-loop pass in the item list
+
 BUILDER_THEMES = list(THEME_REGISTRY.keys())
 THEME_NAMES = [THEME_REGISTRY[k]["label"] for k in BUILDER_THEMES]
 DEFAULT_THEME = "clinical"
 
+DEFAULT_PARAMS = {
+    "calibration": DEFAULT_CALIBRATION,
+    "filter": DEFAULT_FILTER,
+    "dwell_time": DEFAULT_DWELL_TIME,
+    "blink_time": DEFAULT_BLINK_TIME,
+    "dense_rows": DEFAULT_DENSE_ROWS,
+    "dense_col": DEFAULT_DENSE_COLUMNS,
+    "kde_confidence": DEFAULT_KDE_CONFIDENCE,
+    "ema_strength": DEFAULT_EMA_STRENGTH,
+    "gazepoint_blocked": False,
+    "theme": DEFAULT_THEME,
+}
+
 # ------------------ helpers ------------------
 
+@lru_cache(maxsize=None)
+def _orjson():
+    # imported on first save/preview instead of at builder startup; None when not installed
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
 def pretty_json(data) -> str:
+    # orjson formats in C and emits the same layout as json.dumps(indent=2, ensure_ascii=False)
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
     return json.dumps(data, indent=2, ensure_ascii=False)
 
-def type_colors(theme: str) -> dict:
-    fallback_theme = "clinical"
-    theme_map = TYPE_COLOR_THEMES.get(theme, TYPE_COLOR_THEMES[fallback_theme])
-    base = TYPE_COLOR_THEMES[fallback_theme]
-    merged = dict(base)
-    merged.update(theme_map)
-    return merged
+def validate_doc(data) -> None:
+    """Raise ValueError if data is not a questionnaire document the builder can load."""
+    if not isinstance(data, dict):
+        raise ValueError("Top level must be an object.")
+    params = data.get("params", {})
+    if not isinstance(params, dict):
+        raise ValueError("'params' must be an object.")
+    items = data.get("items")
+    if not isinstance(items, list):
+        raise ValueError("Missing 'items' list.")
+    # checked once here so every row in the model is known to hold a dict
+    if not all(isinstance(it, dict) for it in items):
+        raise ValueError("Every entry in 'items' must be an object.")
+
+def write_atomic(path: Path, text: str):
+    # write next to the target and swap it in, so a crash mid-write never leaves a truncated questionnaire
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(text.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 def apply_theme(app: QApplication, theme_key: str):
     app.setStyle("Fusion")
@@ -116,6 +170,12 @@ def qtype_to_label(qtype: str) -> str:
         return "Text"
     return qtype.capitalize()
 
+def format_item_label(it: dict) -> str:
+    txt = (it.get("text", "") or "").replace("\n", " ").strip()
+    if len(txt) > 45:
+        txt = txt[:45] + "…"
+    return txt
+
 def activation_to_label(act: str) -> str:
     act = (act or "").strip().lower()
     if act == "smooth_pursuit":
@@ -125,20 +185,90 @@ def activation_to_label(act: str) -> str:
     return act.replace("_", " ").title()
 
 
-# ------------------ DnD list widget ------------------
+# ------------------ Items model ------------------
+
+class ItemsModel(QAbstractListModel):
+    """List model over the questionnaire items; only rows the view actually shows get painted."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items: list[dict] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self.items)):
+            return None
+        it = self.items[index.row()]
+        if role == Qt.DisplayRole:
+            return format_item_label(it)
+        if role == Qt.UserRole:
+            return it
+        return None
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return Qt.MoveAction
+
+    def moveRows(self, src_parent: QModelIndex, src_row: int, count: int,
+                 dst_parent: QModelIndex, dst_row: int) -> bool:
+        if src_parent.isValid() or dst_parent.isValid():
+            return False
+        if count <= 0 or src_row < 0 or src_row + count > len(self.items):
+            return False
+        if not self.beginMoveRows(src_parent, src_row, src_row + count - 1, dst_parent, dst_row):
+            return False
+        moved = self.items[src_row:src_row + count]
+        del self.items[src_row:src_row + count]
+        at = dst_row - count if dst_row > src_row else dst_row
+        self.items[at:at] = moved
+        self.endMoveRows()
+        return True
+
+    def sync(self, items: list[dict]):
+        # items are never mutated in place (edits swap in a new dict), so identity is a stable row key
+        old_ids = [id(it) for it in self.items]
+        new_ids = [id(it) for it in items]
+        if old_ids == new_ids:
+            return
 
-class ReorderListWidget(QListWidget):
+        ops = SequenceMatcher(None, old_ids, new_ids, autojunk=False).get_opcodes()
+        # apply back to front so the row indices of earlier opcodes stay valid
+        for tag, i1, i2, j1, j2 in reversed(ops):
+            if tag == "equal":
+                continue
+            if tag == "replace" and i2 - i1 == j2 - j1:
+                self.items[i1:i2] = items[j1:j2]
+                self.dataChanged.emit(self.index(i1), self.index(i2 - 1))
+                continue
+            if i2 > i1:
+                self.beginRemoveRows(QModelIndex(), i1, i2 - 1)
+                del self.items[i1:i2]
+                self.endRemoveRows()
+            if j2 > j1:
+                self.beginInsertRows(QModelIndex(), i1, i1 + (j2 - j1) - 1)
+                self.items[i1:i1] = items[j1:j2]
+                self.endInsertRows()
+
+# ------------------ DnD list view ------------------
+
+class ReorderListView(QListView):
     orderChanged = Signal()
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.setSelectionMode(QListWidget.SingleSelection)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
         self.setDefaultDropAction(Qt.MoveAction)
-        self.setDragDropMode(QListWidget.InternalMove)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
 
         self.viewport().setMouseTracking(True)
         self.viewport().installEventFilter(self)
@@ -148,7 +278,7 @@ class ReorderListWidget(QListWidget):
         if obj is self.viewport():
             et = event.type()
             if et in (QEvent.MouseMove, QEvent.Enter):
-                over_item = self.itemAt(event.pos()) is not None
+                over_item = self.indexAt(event.pos()).isValid()
                 self.viewport().setCursor(Qt.OpenHandCursor if over_item else Qt.ArrowCursor)
         return super().eventFilter(obj, event)
 
@@ -158,25 +288,12 @@ class ReorderListWidget(QListWidget):
             super().startDrag(supportedActions)
         finally:
             pos = self.viewport().mapFromGlobal(self.cursor().pos())
-            over_item = self.itemAt(pos) is not None
+            over_item = self.indexAt(pos).isValid()
             self.viewport().setCursor(Qt.OpenHandCursor if over_item else Qt.ArrowCursor)
 
     def dropEvent(self, event):
-        selected_obj = None
-        cur = self.currentItem()
-        if cur is not None:
-            selected_obj = cur.data(Qt.UserRole)
-
+        # internal moves go through ItemsModel.moveRows, which keeps the current index on the moved row
         super().dropEvent(event)
-
-        if selected_obj is not None:
-            for i in range(self.count()):
-                it = self.item(i)
-                if it is not None and it.data(Qt.UserRole) is selected_obj:
-                    self.setCurrentRow(i)
-                    it.setSelected(True)
-                    break
-
         self.orderChanged.emit()
 
 # ------------------ Item Editor ------------------
@@ -190,21 +307,19 @@ class CardItemDelegate(QStyledItemDelegate):
         painter.save()
 
         theme = self.get_theme()
-        palette = type_colors(theme)
 
-        it = index.data(Qt.UserRole) or {}
+        it = index.data(Qt.UserRole)
         qtype = it.get("type", "info")
         q_label = qtype_to_label(qtype)
 
         a_label = activation_to_label(it.get("activation", ""))
 
-        c = palette.get(qtype, palette["info"])
+        c = qcolors(theme, qtype)
         r = option.rect.adjusted(10, 6, -10, -6)
-        bg = QColor(c["bg"])
-        fg = QColor(c["fg"])
+        fg = c.fg
 
         painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setBrush(bg)
+        painter.setBrush(c.bg_brush)
         painter.drawRoundedRect(r, 10, 10)
 
         fm = QFontMetrics(painter.font())
@@ -456,7 +571,7 @@ class AddItemCommand(QUndoCommand):
         else:
             self.win.items.insert(self.index, self.item)
         self.win.refresh()
-        self.win.list_widget.setCurrentRow(self.index)
+        self.win.select_row(self.index)
 
     def undo(self):
         if 0 <= self.index < len(self.win.items):
@@ -475,14 +590,14 @@ class DeleteItemCommand(QUndoCommand):
         if 0 <= self.index < len(self.win.items):
             del self.win.items[self.index]
         self.win.refresh()
-        self.win.list_widget.setCurrentRow(min(self.index, len(self.win.items) - 1))
+        self.win.select_row(min(self.index, len(self.win.items) - 1))
 
     def undo(self):
         if self.index > len(self.win.items):
             self.index = len(self.win.items)
         self.win.items.insert(self.index, self.item)
         self.win.refresh()
-        self.win.list_widget.setCurrentRow(self.index)
+        self.win.select_row(self.index)
 
 
 class EditItemCommand(QUndoCommand):
@@ -497,13 +612,13 @@ class EditItemCommand(QUndoCommand):
         if 0 <= self.index < len(self.win.items):
             self.win.items[self.index] = self.new_item
         self.win.refresh()
-        self.win.list_widget.setCurrentRow(self.index)
+        self.win.select_row(self.index)
 
     def undo(self):
         if 0 <= self.index < len(self.win.items):
             self.win.items[self.index] = self.old_item
         self.win.refresh()
-        self.win.list_widget.setCurrentRow(self.index)
+        self.win.select_row(self.index)
 
 
 class ReorderItemsCommand(QUndoCommand):
@@ -532,6 +647,8 @@ class BuilderMainWindow(QMainWindow):
         self.update_window_title()
 
         self.items: list[dict] = []
+        self._suspend_refresh: bool = False
+        self._theme_pending: bool = False
         self.current_path: Path | None = None
         self.gazepoint_blocked: bool = False
 
@@ -545,8 +662,16 @@ class BuilderMainWindow(QMainWindow):
 
         self._build_toolbar()
         self._build_ui()
+        self._build_file_dialogs()
 
-        self.statusBar().showMessage("Ready")
+        self._status("Ready")
+
+    def _status(self, msg: str, timeout: int = 0):
+        # setters and their handlers often report the same text back to back; skip the repaint then
+        bar = self.statusBar()
+        if msg == bar.currentMessage():
+            return
+        bar.showMessage(msg, timeout)
 
     def update_window_title(self):
         shown = self.filename if self.filename else "*"
@@ -658,6 +783,12 @@ class BuilderMainWindow(QMainWindow):
         self.dwell_spin.valueChanged.connect(self.on_dwell_changed)
         self.dwell_spin.setCursor(Qt.PointingHandCursor)
 
+        self._pending_dwell: int = self.dwell_time
+        self._dwell_debounce = QTimer(self)
+        self._dwell_debounce.setSingleShot(True)
+        self._dwell_debounce.setInterval(SPIN_DEBOUNCE_MS)
+        self._dwell_debounce.timeout.connect(self._apply_pending_dwell)
+
         self.blink_time: int = DEFAULT_BLINK_TIME
         self.blink_spin = QSpinBox()
         self.blink_spin.setFixedWidth(70)
@@ -668,6 +799,12 @@ class BuilderMainWindow(QMainWindow):
         self.blink_spin.valueChanged.connect(self.on_blink_changed)
         self.blink_spin.setCursor(Qt.PointingHandCursor)
 
+        self._pending_blink: int = self.blink_time
+        self._blink_debounce = QTimer(self)
+        self._blink_debounce.setSingleShot(True)
+        self._blink_debounce.setInterval(SPIN_DEBOUNCE_MS)
+        self._blink_debounce.timeout.connect(self._apply_pending_blink)
+
         # -------- Theme Box --------
         self.theme_box = QComboBox()
         for key_theme in BUILDER_THEMES:
@@ -743,23 +880,49 @@ class BuilderMainWindow(QMainWindow):
         self.act_edit.triggered.connect(self.edit_item)
         self.act_del.triggered.connect(self.delete_item)
 
-    def _build_ui(self):
-        self.list_widget = ReorderListWidget()
-        self.list_widget.setItemDelegate(CardItemDelegate(self.list_widget, get_theme=lambda: self.theme))
-        self.list_widget.setWordWrap(True)
-        self.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.list_widget.setVerticalScrollMode(QListWidget.ScrollPerPixel)
-        self.list_widget.setSpacing(6)
+    def _build_file_dialogs(self):
+        # kept for the window's lifetime: reopening is cheaper and they remember the last directory
+        self._save_dlg = QFileDialog(self, "Save JSON")
+        self._save_dlg.setNameFilter("JSON (*.json)")
+        self._save_dlg.setAcceptMode(QFileDialog.AcceptSave)
+        self._save_dlg.setDefaultSuffix("json")
+        self._save_dlg.selectFile("demo.json")
+
+        self._load_dlg = QFileDialog(self, "Load JSON")
+        self._load_dlg.setNameFilter("JSON (*.json)")
+        self._load_dlg.setAcceptMode(QFileDialog.AcceptOpen)
+        self._load_dlg.setFileMode(QFileDialog.ExistingFile)
+
+    @staticmethod
+    def _exec_file_dialog(dlg: QFileDialog) -> str:
+        if not dlg.exec():
+            return ""
+        files = dlg.selectedFiles()
+        return files[0] if files else ""
 
-        self.list_widget.orderChanged.connect(self.on_list_reordered)
-        self.list_widget.itemActivated.connect(lambda _: self.edit_item())
+    def _build_ui(self):
+        self.items_model = ItemsModel(self)
+        self.list_view = ReorderListView()
+        self.list_view.setObjectName("ItemsList")
+        self.list_view.setModel(self.items_model)
+        self.list_view.setItemDelegate(CardItemDelegate(self.list_view, get_theme=lambda: self.theme))
+        self.list_view.setWordWrap(True)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.list_view.setSpacing(6)
+        # lay out long lists in chunks between events instead of measuring every row up front
+        self.list_view.setLayoutMode(QListView.Batched)
+        self.list_view.setBatchSize(LIST_BATCH_SIZE)
+
+        self.list_view.orderChanged.connect(self.on_list_reordered)
+        self.list_view.activated.connect(lambda _: self.edit_item())
 
         self.json_preview = QTextEdit()
         self.json_preview.setReadOnly(True)
 
         left = QVBoxLayout()
         left.addWidget(QLabel("Items"))
-        left.addWidget(self.list_widget, 1)
+        left.addWidget(self.list_view, 1)
 
         right = QVBoxLayout()
         right.addWidget(QLabel("JSON Preview"))
@@ -782,16 +945,20 @@ class BuilderMainWindow(QMainWindow):
             return
 
         self.theme = theme_key
-        apply_theme(QApplication.instance(), self.theme)
+        if self._suspend_refresh:
+            # restyling the whole app is the costliest step; a batch applies it once on exit
+            self._theme_pending = True
+        else:
+            apply_theme(QApplication.instance(), self.theme)
 
         if update_combo and hasattr(self, "theme_box"):
             set_combo_by_data(self.theme_box, self.theme)
 
-        self.list_widget.viewport().update()
+        self.list_view.viewport().update()
         self.refresh()
 
         if show_status:
-            self.statusBar().showMessage(f"Theme: {THEME_NAMES[BUILDER_THEMES.index(self.theme)]}", 1200)
+            self._status(f"Theme: {THEME_NAMES[BUILDER_THEMES.index(self.theme)]}", 1200)
 
     def cycle_theme(self):
         order = BUILDER_THEMES
@@ -810,7 +977,7 @@ class BuilderMainWindow(QMainWindow):
 
         self.refresh()
         if show_status:
-            self.statusBar().showMessage(f"Calibration: {self.calibration}", 1200)
+            self._status(f"Calibration: {self.calibration}", 1200)
 
     def set_filter(self, filter_key: str, *, update_combo: bool = True, show_status: bool = True):
         if filter_key not in FILTERS:
@@ -824,17 +991,19 @@ class BuilderMainWindow(QMainWindow):
 
         self.refresh()
         if show_status:
-            self.statusBar().showMessage(f"Filter: {self.filter}", 1200)
+            self._status(f"Filter: {self.filter}", 1200)
 
     def set_dwell_time(self, value: int, *, update_spin: bool = True):
         self.dwell_time = int(value)
         if update_spin and hasattr(self, "dwell_spin"):
+            self._dwell_debounce.stop()
             set_spin_silent(self.dwell_spin, self.dwell_time)
         self.refresh()
 
     def set_blink_time(self, value: int, *, update_spin: bool = True):
         self.blink_time = int(value)
         if update_spin and hasattr(self, "blink_spin"):
+            self._blink_debounce.stop()
             set_spin_silent(self.blink_spin, self.blink_time)
         self.refresh()
 
@@ -884,32 +1053,35 @@ class BuilderMainWindow(QMainWindow):
             "items": self.items,
         }
 
-    @staticmethod
-    def format_item_label(it: dict, idx: int) -> str:
-        txt = (it.get("text", "") or "").replace("\n", " ").strip()
-        if len(txt) > 45:
-            txt = txt[:45] + "…"
-        return f"{txt}"
+    def current_row(self) -> int:
+        idx = self.list_view.currentIndex()
+        return idx.row() if idx.isValid() else -1
+
+    def select_row(self, row: int):
+        if 0 <= row < self.items_model.rowCount():
+            self.list_view.setCurrentIndex(self.items_model.index(row))
+
+    @contextmanager
+    def _batch_updates(self):
+        # setters inside the block skip their own refresh() and stylesheet; both run once on exit
+        was_suspended = self._suspend_refresh
+        self._suspend_refresh = True
+        self.list_view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self._suspend_refresh = was_suspended
+            if not was_suspended:
+                if self._theme_pending:
+                    self._theme_pending = False
+                    apply_theme(QApplication.instance(), self.theme)
+                self.list_view.setUpdatesEnabled(True)
+                self.refresh()
 
     def refresh(self):
-        selected_obj = None
-        row = self.list_widget.currentRow()
-        if 0 <= row < self.list_widget.count():
-            selected_obj = self.list_widget.item(row).data(Qt.UserRole)
-
-        self.list_widget.blockSignals(True)
-        self.list_widget.clear()
-        for i, it in enumerate(self.items, 1):
-            lw_item = QListWidgetItem(self.format_item_label(it, i))
-            lw_item.setData(Qt.UserRole, it)
-            self.list_widget.addItem(lw_item)
-        self.list_widget.blockSignals(False)
-
-        if selected_obj is not None:
-            for i in range(self.list_widget.count()):
-                if self.list_widget.item(i).data(Qt.UserRole) is selected_obj:
-                    self.list_widget.setCurrentRow(i)
-                    break
+        if self._suspend_refresh:
+            return
+        self.items_model.sync(self.items)
 
         if hasattr(self, "cb_gazepoint"):
             set_checkbox_silent(self.cb_gazepoint, bool(self.gazepoint_blocked))
@@ -928,44 +1100,60 @@ class BuilderMainWindow(QMainWindow):
     # ---------- drag&drop reorder ----------
     def on_list_reordered(self):
         old_items = list(self.items)
-        new_items = [
-            self.list_widget.item(i).data(Qt.UserRole)
-            for i in range(self.list_widget.count())
-            if isinstance(self.list_widget.item(i).data(Qt.UserRole), dict)
-        ]
-        if new_items == old_items:
+        # the model already holds the dropped order, so redo()'s refresh has nothing to sync
+        new_items = list(self.items_model.items)
+        # same dict objects, possibly reordered: comparing identities avoids a deep dict compare
+        if [id(it) for it in new_items] == [id(it) for it in old_items]:
             return
         self.undo_stack.push(ReorderItemsCommand(self, old_items, new_items))
-        self.statusBar().showMessage("Reordered", 1200)
+        self._status("Reordered", 1200)
 
     def on_gazepoint_blocked_changed(self, checked: bool):
         self.gazepoint_blocked = bool(checked)
         self.refresh()
-        self.statusBar().showMessage(f"Hide Gazepoint: {self.gazepoint_blocked}", 1500)
+        self._status(f"Hide Gazepoint: {self.gazepoint_blocked}", 1500)
 
     def on_dwell_changed(self, value: int):
-        self.set_dwell_time(value, update_spin=False)
-        self.statusBar().showMessage(f"Dwell Threshold: {self.dwell_time}", 1500)
+        # key-repeat on the spin fires many times per second; only the last value is applied
+        self._pending_dwell = int(value)
+        self._dwell_debounce.start()
+
+    def _apply_pending_dwell(self):
+        self.set_dwell_time(self._pending_dwell, update_spin=False)
+        self._status(f"Dwell Threshold: {self.dwell_time}", 1500)
 
     def on_blink_changed(self, value: int):
-        self.set_blink_time(value, update_spin=False)
-        self.statusBar().showMessage(f"Blink Threshold: {self.blink_time}", 1500)
+        self._pending_blink = int(value)
+        self._blink_debounce.start()
+
+    def _apply_pending_blink(self):
+        self.set_blink_time(self._pending_blink, update_spin=False)
+        self._status(f"Blink Threshold: {self.blink_time}", 1500)
+
+    def _flush_pending_spins(self):
+        # a value still waiting on its debounce must reach doc() before it is written out
+        if self._dwell_debounce.isActive():
+            self._dwell_debounce.stop()
+            self._apply_pending_dwell()
+        if self._blink_debounce.isActive():
+            self._blink_debounce.stop()
+            self._apply_pending_blink()
 
     def on_kde_confidence_changed(self, value: float):
         self.set_kde_confidence(value, update_spin=False)
-        self.statusBar().showMessage(f"KDE Confidence: {self.kde_confidence}", 1500)
+        self._status(f"KDE Confidence: {self.kde_confidence}", 1500)
 
     def on_ema_strength_changed(self, value: float):
         self.set_ema_strength(value, update_spin=False)
-        self.statusBar().showMessage(f"EMA Kalman Strength: {self.ema_strength}", 1500)
+        self._status(f"EMA Kalman Strength: {self.ema_strength}", 1500)
 
     def on_dense_rows_changed(self, value: int):
         self.set_dense_rows(value, update_spin=False)
-        self.statusBar().showMessage(f"Dense Calibration Rows: {value}", 1500)
+        self._status(f"Dense Calibration Rows: {value}", 1500)
 
     def on_dense_col_changed(self, value: int):
         self.set_dense_col(value, update_spin=False)
-        self.statusBar().showMessage(f"Dense Calibration Columns: {value}", 1500)
+        self._status(f"Dense Calibration Columns: {value}", 1500)
 
     def on_theme_changed(self, _index: int):
         theme_key = self.theme_box.currentData() or "clinical"
@@ -974,12 +1162,12 @@ class BuilderMainWindow(QMainWindow):
     def on_calibration_changed(self, _index: int):
         calibration_key = self.calibration_box.currentData()
         self.set_calibration(calibration_key or DEFAULT_CALIBRATION)
-        self.statusBar().showMessage(f"Calibration: {self.calibration}", 1500)
+        self._status(f"Calibration: {self.calibration}", 1500)
 
     def on_filter_changed(self, _index: int):
         filter_key = self.filter_box.currentData()
         self.set_filter(filter_key or DEFAULT_FILTER)
-        self.statusBar().showMessage(f"Filter: {self.filter}", 1500)
+        self._status(f"Filter: {self.filter}", 1500)
 
     # ---------- actions ----------
     def add_item(self):
@@ -987,10 +1175,10 @@ class BuilderMainWindow(QMainWindow):
         if dlg.exec():
             item = dlg.get_item()
             self.undo_stack.push(AddItemCommand(self, item, index=len(self.items)))
-            self.statusBar().showMessage("Item added", 1500)
+            self._status("Item added", 1500)
 
     def edit_item(self):
-        row = self.list_widget.currentRow()
+        row = self.current_row()
         if not (0 <= row < len(self.items)):
             return
         old_item = self.items[row]
@@ -998,15 +1186,15 @@ class BuilderMainWindow(QMainWindow):
         if dlg.exec():
             new_item = dlg.get_item()
             self.undo_stack.push(EditItemCommand(self, row, old_item, new_item))
-            self.statusBar().showMessage("Item updated", 1500)
+            self._status("Item updated", 1500)
 
     def delete_item(self):
-        row = self.list_widget.currentRow()
+        row = self.current_row()
         if not (0 <= row < len(self.items)):
             return
         item = self.items[row]
         self.undo_stack.push(DeleteItemCommand(self, row, item))
-        self.statusBar().showMessage("Item deleted", 1500)
+        self._status("Item deleted", 1500)
 
     def new_json(self):
         self.items = []
@@ -1015,12 +1203,13 @@ class BuilderMainWindow(QMainWindow):
         self.filename = "*"
         self.update_window_title()
         self.refresh()
-        self.statusBar().showMessage("New document", 1500)
+        self._status("New document", 1500)
         self.undo_stack.clear()
 
     def save_json(self):
+        self._flush_pending_spins()
         if self.current_path is None:
-            path, _ = QFileDialog.getSaveFileName(self, "Save JSON", "demo.json", "JSON (*.json)")
+            path = self._exec_file_dialog(self._save_dlg)
             if not path:
                 return
             self.current_path = Path(path)
@@ -1028,53 +1217,56 @@ class BuilderMainWindow(QMainWindow):
             self.update_window_title()
 
         try:
-            self.current_path.write_text(pretty_json(self.doc()), encoding="utf-8")
+            write_atomic(self.current_path, pretty_json(self.doc()))
         except Exception as e:
             QMessageBox.critical(self, "Save failed", str(e))
             return
 
-        self.statusBar().showMessage("Saved", 1500)
+        self._status("Saved", 1500)
         self.undo_stack.clear()
 
     def load_json(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Load JSON", "", "JSON (*.json)")
+        path = self._exec_file_dialog(self._load_dlg)
         if not path:
             return
 
+        p = Path(path)
         try:
-            data = json.loads(Path(path).read_text(encoding="utf-8"))
-            self.filename = str(Path(path).name)
-            self.update_window_title()
-
+            data = json.loads(p.read_bytes())
         except Exception as e:
             QMessageBox.warning(self, "Invalid JSON", f"Could not parse JSON:\n{e}")
             return
 
-        # Params
-        self.set_calibration(data["params"].get("calibration", DEFAULT_CALIBRATION), show_status=False)
-        self.set_filter(data["params"].get("filter", DEFAULT_FILTER), show_status=False)
-        self.set_dwell_time(int(data["params"].get("dwell_time", DEFAULT_DWELL_TIME)))
-        self.set_blink_time(int(data["params"].get("blink_time", DEFAULT_BLINK_TIME)))
-        self.set_dense_rows(int(data["params"].get("dense_rows", DEFAULT_DENSE_ROWS)))
-        self.set_dense_col(int(data["params"].get("dense_col", DEFAULT_DENSE_COLUMNS)))
-        self.set_kde_confidence(float(data["params"].get("kde_confidence", DEFAULT_KDE_CONFIDENCE)))
-        self.set_ema_strength(float(data["params"].get("ema_strength", DEFAULT_EMA_STRENGTH)))
-        gp = data["params"].get("gazepoint_blocked", False)
-        if isinstance(gp, str):
-            gp = gp.strip().lower() in ("true", "1", "yes")
-        self.gazepoint_blocked = bool(gp)
-        self.set_theme(data["params"].get("theme", DEFAULT_THEME), show_status=False)
-
-        # Items
-        items = data.get("items")
-        if not isinstance(items, list):
-            QMessageBox.warning(self, "Invalid JSON", "Missing 'items' list.")
+        try:
+            validate_doc(data)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid JSON", str(e))
             return
-        self.items = items
+        params = DEFAULT_PARAMS | data.get("params", {})
+
+        with self._batch_updates():
+            # Params
+            self.set_calibration(params["calibration"], show_status=False)
+            self.set_filter(params["filter"], show_status=False)
+            self.set_dwell_time(int(params["dwell_time"]))
+            self.set_blink_time(int(params["blink_time"]))
+            self.set_dense_rows(int(params["dense_rows"]))
+            self.set_dense_col(int(params["dense_col"]))
+            self.set_kde_confidence(float(params["kde_confidence"]))
+            self.set_ema_strength(float(params["ema_strength"]))
+            gp = params["gazepoint_blocked"]
+            if isinstance(gp, str):
+                gp = gp.lower() in TRUTHY_STRINGS
+            self.gazepoint_blocked = bool(gp)
+            self.set_theme(params["theme"], show_status=False)
+
+            # Items
+            self.items = data["items"]
+            self.current_path = p
+            self.filename = p.name
+            self.update_window_title()
 
-        self.current_path = Path(path)
-        self.refresh()
-        self.statusBar().showMessage("Loaded", 1500)
+        self._status("Loaded", 1500)
 
 # ------------------ main ------------------
 
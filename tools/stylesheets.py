@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 # Theme definition
@@ -60,10 +61,10 @@ class ThemePalette:
 
 # Builder
 
+@lru_cache(maxsize=None)
 def build_stylesheet(p: ThemePalette) -> str:
     checkbox_text = p.checkbox_text or p.text
 
-    list_border = ""
     if p.list_border:
         list_border = f"border: {p.list_border};"
     else:
@@ -113,15 +114,15 @@ QToolButton:pressed {{
 }}
 
 /* --- List --- */
-QListWidget {{
+QListView#ItemsList {{
     background: {p.list_bg};
     {list_border}
     border-radius: 5px;
 }}
-QListWidget::item {{
+QListView#ItemsList::item {{
     padding: 2px;
 }}
-QListWidget::item:selected {{
+QListView#ItemsList::item:selected {{
     background: {p.list_item_selected_bg};
     color: {p.list_item_selected_text};
     border-radius: 8px;
@@ -147,14 +148,7 @@ QComboBox {{
     border-radius: 4px;
 }}
 
-QSpinBox {{
-    background: {p.spin_bg};
-    padding: 0px;
-    min-height: 18px;
-    color: {p.spin_text};
-    border-radius: 4px;
-}}
-
+QSpinBox,
 QDoubleSpinBox {{
     background: {p.spin_bg};
     padding: 0px;
@@ -202,9 +196,7 @@ QScrollBar::sub-line:vertical {{
     height: 0px;
 }}
 
-QToolButton:enabled {{
-    background: {p.undo_redo};
-}}
+QToolButton:enabled,
 QToolButton:disabled {{
     background: {p.undo_redo};
 }}
@@ -498,3 +490,16 @@ def forest_mist_stylesheet() -> str:
 
 def signal_contrast_stylesheet() -> str:
     return build_stylesheet(_SIGNAL)
+
+
+# Registry: theme key -> zero-arg loader. The QSS text is only built when a theme is first applied.
+
+STYLESHEETS = {
+    "neon": neon_stylesheet,
+    "retro_terminal": retro_terminal_stylesheet,
+    "clinical": clinical_stylesheet,
+    "oled_dark": oled_dark_stylesheet,
+    "sunset_synth": sunset_synth_stylesheet,
+    "forest_mist": forest_mist_stylesheet,
+    "signal_contrast": signal_contrast_stylesheet,
+}
@@ -1,4 +1,18 @@
-TYPE_COLOR_THEMES: dict[str, dict[str, dict[str, str]]] = {
+from typing import NamedTuple
+
+from PySide6.QtGui import QBrush, QColor
+
+FALLBACK_THEME = "clinical"
+
+
+class QColors(NamedTuple):
+    bg: QColor
+    accent: QColor
+    fg: QColor
+    bg_brush: QBrush
+
+
+_TYPE_COLOR_THEMES: dict[str, dict[str, dict[str, str]]] = {
     "neon": {
         "info":     {"bg": "#0F1838", "accent": "#66F0FF", "fg": "#EAF2FF"},
         "yesno":    {"bg": "#0F1838", "accent": "#66F0FF", "fg": "#EAF2FF"},
@@ -71,3 +85,23 @@ TYPE_COLOR_THEMES: dict[str, dict[str, dict[str, str]]] = {
     },
 
 }
+
+# Flat (theme, type) table, one hash per lookup instead of three nested dict gets.
+# Parsed once here so paint code never re-parses hex strings; treat these as read-only
+TYPE_COLOR_OBJECTS: dict[tuple[str, str], QColors] = {
+    (theme, qtype): QColors(QColor(c["bg"]), QColor(c["accent"]), QColor(c["fg"]), QBrush(QColor(c["bg"])))
+    for theme, types in _TYPE_COLOR_THEMES.items()
+    for qtype, c in types.items()
+}
+del _TYPE_COLOR_THEMES
+
+
+def qcolors(theme: str, qtype: str) -> QColors:
+    c = TYPE_COLOR_OBJECTS.get((theme, qtype))
+    if c is not None:
+        return c
+    return (
+        TYPE_COLOR_OBJECTS.get((FALLBACK_THEME, qtype))
+        or TYPE_COLOR_OBJECTS.get((theme, "info"))
+        or TYPE_COLOR_OBJECTS[(FALLBACK_THEME, "info")]
+    )
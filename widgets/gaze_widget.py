@@ -255,6 +255,7 @@ class GazeWidget(QWidget):
 
         self.gaze_x: float | None = None
         self.gaze_y: float | None = None
+        self._gaze_mapped: tuple[int, int] | None = None  # widget coords of the current sample
 
         self.screen_width, self.screen_height = get_screen_size()
 
@@ -263,45 +264,63 @@ class GazeWidget(QWidget):
 
         self.point_radius = 10
         self.theme = ClinicalTheme()  # default
+        self._update_gaze_colors()
 
     @Slot(float, float)
     def set_gaze(self, x: float, y: float):
+        self._store_gaze(x, y)
+        self.update()
+
+    def _store_gaze(self, x: float, y: float):
         self.gaze_x = x
         self.gaze_y = y
-        self.update()
+        self._gaze_mapped = None
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        self._gaze_mapped = None
 
     def map_gaze_to_widget(self):
+        # set_gaze handlers and paintEvent both ask for the same sample; map it once
+        if self._gaze_mapped is not None:
+            return self._gaze_mapped
         if self.gaze_x is None or self.gaze_y is None:
             return None, None
-        return (
+        self._gaze_mapped = (
             int((self.gaze_x / self.screen_width) * self.width()),
             int((self.gaze_y / self.screen_height) * self.height()),
         )
+        return self._gaze_mapped
 
     def _pulse(self):
         t = self._pulse_timer.elapsed() / 1000.0
         return 0.5 + 0.5 * math.sin(t * 2.0 * math.pi * 0.35)
 
+    def _update_gaze_colors(self):
+        # built per theme, not per frame; only the halo alpha changes while painting
+        self._gaze_halo = QColor(self.theme.gaze)
+        self._gaze_core = QColor(self.theme.gaze)
+        self._gaze_core.setAlpha(235)
+
     def _draw_gaze(self, p: QPainter):
         gx, gy = self.map_gaze_to_widget()
         if gx is None or gy is None:
             return
 
         p.save()
-        p.setRenderHint(QPainter.Antialiasing, True)
+        # most paintEvents already enabled it; avoid a redundant state change
+        if not p.testRenderHint(QPainter.Antialiasing):
+            p.setRenderHint(QPainter.Antialiasing, True)
 
         r = self.point_radius
         pulse = self._pulse()
 
-        halo = QColor(self.theme.gaze)
-        halo.setAlpha(int(35 + 35 * pulse))
+        self._gaze_halo.setAlpha(int(35 + 35 * pulse))
         p.setPen(Qt.NoPen)
-        p.setBrush(halo)
+        p.setBrush(self._gaze_halo)
         p.drawEllipse(QPointF(gx, gy), r * 2, r * 2)
 
-        core = QColor(self.theme.gaze)
-        core.setAlpha(235)
-        p.setBrush(core)
+        p.setBrush(self._gaze_core)
         p.drawEllipse(QPointF(gx, gy), r, r)
 
         p.restore()
@@ -317,3 +336,4 @@ class GazeWidget(QWidget):
             "signal_contrast": SignalContrastTheme,
         }
         self.theme = THEMES.get(theme, ClinicalTheme)()
+        self._update_gaze_colors()
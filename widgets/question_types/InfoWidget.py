@@ -1,7 +1,7 @@
 # widgets/InfoWidget.py
 from __future__ import annotations
 
-from PySide6.QtCore import QTimer, Signal, QRect, QRectF
+from PySide6.QtCore import QTimer, QTimeLine, QEasingCurve, Signal, QRect, QRectF
 from PySide6.QtGui import (
     QFontMetrics,
     QLinearGradient,
@@ -9,6 +9,7 @@ from PySide6.QtGui import (
     QPen,
     QBrush,
     QPixmap, QFont, QFontDatabase,
+    QStaticText, QTextOption, QTransform,
 )
 
 from widgets.gaze_widget import *
@@ -29,6 +30,9 @@ def _try_load_futuristic_font() -> QFont:
 class InfoWidget(GazeWidget):
     submitted = Signal(object)
 
+    MIN_TICK_MS = 33          # ~30 FPS, never tick faster than this
+    BAR_PX_ESTIMATE = 800     # track width guess until the first resize
+
     def __init__(self, parent, gazepoint_blocked: bool, theme: str, text: str, duration_sec: int):
         super().__init__(parent)
 
@@ -37,89 +41,165 @@ class InfoWidget(GazeWidget):
         self.duration_ms = max(1, int(duration_sec * 1000))
 
         self.matchTheme(theme)
+        self._build_theme_colors()
 
         self.base_font = _try_load_futuristic_font()
 
-        self.timer = QElapsedTimer()
-        self.timer.start()
-
-        # Weniger Ticks = weniger Last. 33ms ~ 30 FPS, für Progress reicht das meist völlig.
-        self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.on_tick)
-        self.update_timer.start(33)
-
         self.done = False
+        self._progress = 0.0
+
+        # One Qt-driven 0 -> 1 timeline replaces polling an elapsed timer from a QTimer.
+        self.timeline = QTimeLine(self.duration_ms, self)
+        self.timeline.setEasingCurve(QEasingCurve.Linear)
+        self.timeline.setUpdateInterval(self._tick_interval(self.BAR_PX_ESTIMATE))
+        self.timeline.valueChanged.connect(self.on_progress)
+        self.timeline.finished.connect(self.on_finished)
+        self.timeline.start()
+
+        # While hidden the timeline is paused; these keep the page on wall-clock time
+        self._hidden_clock = QElapsedTimer()
+        self._hidden_deadline = QTimer(self)
+        self._hidden_deadline.setSingleShot(True)
+        self._hidden_deadline.timeout.connect(self.on_finished)
 
         # Caches
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
+        # bg below the pulsing overlay, text + empty progress track above it; rebuilt only on resize
+        self._chrome = QPixmap()
+        self._chrome_fg = QPixmap()
+        self._chrome_size = None
 
         self._scan_tile = QPixmap()  # 1 tile for scanlines
         self._scan_tile_ready = False
 
-        self._text_cache = QPixmap()
-        self._text_cache_key = None  # (w, h, text, font_point, bold)
-
         self._last_gaze_rect = None  # QRect
+        self._last_fill_px = -1
+
+        self._update_geometry()
 
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setAutoFillBackground(False)
 
+    def _build_theme_colors(self):
+        """Alpha-tinted theme colors used while painting; built once instead of per frame."""
+        t = self.theme
+        self._track_brush = QBrush(t.bar_track)
+        self._border_color = QColor(t.bar_border); self._border_color.setAlpha(190)
+        self._fill_c1 = QColor(t.neon_cyan); self._fill_c1.setAlpha(220)
+        self._fill_c2 = QColor(t.neon_pink); self._fill_c2.setAlpha(200)
+        self._fill_c3 = QColor(t.neon_violet); self._fill_c3.setAlpha(190)
+        self._overlay = QColor(t.neon_violet)  # alpha follows the pulse
+
     # ---------- sizing helpers ----------
 
-    def _text_rect(self) -> QRect:
+    def _update_geometry(self):
+        """Recompute size-dependent rects and the text font; only changes on resize."""
         w, h = self.width(), self.height()
-        return QRect(int(w * 0.10), int(h * 0.12), int(w * 0.80), int(h * 0.65))
+        self._text_rect = QRect(int(w * 0.10), int(h * 0.12), int(w * 0.80), int(h * 0.65))
 
-    def _progress_rect(self) -> QRect:
-        w, h = self.width(), self.height()
         bar_h = int(h * 0.050)
         bar_m = int(w * 0.070)
         bar_y = h - bar_h - int(h * 0.060)
+        self._track = QRectF(bar_m, bar_y, w - 2 * bar_m, bar_h)
+        self._track_radius = bar_h / 2.0
+        self._border_pen = QPen(self._border_color)
+        self._border_pen.setWidth(max(2, int(h * 0.003)))
+
         # plus a little padding for glow/border
         pad = max(6, int(min(w, h) * 0.01))
-        return QRect(bar_m - pad, bar_y - pad, (w - 2 * bar_m) + 2 * pad, bar_h + 2 * pad)
+        self._progress_rect = QRect(bar_m - pad, bar_y - pad, (w - 2 * bar_m) + 2 * pad, bar_h + 2 * pad)
+
+        self._text_font = self._make_font_for_text()
+
+        # Shape/wrap the message once per size; _paint_text stamps it 9x with drawStaticText (glow + main)
+        opt = QTextOption(Qt.AlignHCenter)
+        opt.setWrapMode(QTextOption.WordWrap)
+        self._static_text = QStaticText(self.text)
+        self._static_text.setTextFormat(Qt.PlainText)
+        self._static_text.setTextOption(opt)
+        self._static_text.setTextWidth(self._text_rect.width())
+        self._static_text.prepare(QTransform(), self._text_font)
+
+    def _tick_interval(self, bar_px: int) -> int:
+        # Ticks that cannot advance the bar by a whole pixel are wasted wakeups
+        return max(self.MIN_TICK_MS, self.duration_ms // max(1, bar_px))
+
+    def _fill_px(self, progress: float) -> int:
+        return int(self._track.width() * max(0.0, min(1.0, progress)))
 
     # ---------- animation ----------
 
-    def on_tick(self):
+    def on_progress(self, value: float):
         if self.done:
             return
+        self._progress = value
+        if not self.isVisible() or self.visibleRegion().isEmpty():
+            return
 
-        elapsed = self.timer.elapsed()
-        if elapsed >= self.duration_ms:
-            self.done = True
-            self.update_timer.stop()
-            self.submitted.emit(None)
+        # Long pages advance the bar by less than a pixel per tick; only repaint once it visibly moves
+        fill_px = self._fill_px(value)
+        if fill_px == self._last_fill_px:
+            return
+        self._last_fill_px = fill_px
+        self.update(self._progress_rect)
 
-        # Invalidate only what changes: progress bar region (+ gaze dot region if needed)
-        regions = [self._progress_rect()]
+    def on_finished(self):
+        if self.done:
+            return
+        self.done = True
+        self.timeline.stop()
+        self._hidden_deadline.stop()
+        self._progress = 1.0
+        self.update(self._progress_rect)
+        # emit from the event loop, not from inside the timeline callback: the slot replaces this widget
+        QTimer.singleShot(0, self._emit_submitted)
+
+    def _emit_submitted(self):
+        self.submitted.emit(None)
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        if self.done or self.timeline.state() != QTimeLine.Running:
+            return
+        self.timeline.setPaused(True)
+        self._hidden_clock.start()
+        self._hidden_deadline.start(max(0, self.duration_ms - self.timeline.currentTime()))
 
-        if not self.gazePointBlocked:
-            gx, gy = self.map_gaze_to_widget()
-            if gx is not None and gy is not None:
-                r = int(self.point_radius * 2.6)  # halo area
-                gaze_rect = QRect(int(gx - r), int(gy - r), int(2 * r), int(2 * r))
+    def showEvent(self, e):
+        super().showEvent(e)
+        if self.done or self.timeline.state() != QTimeLine.Paused:
+            return
+        self._hidden_deadline.stop()
+        hidden_ms = self._hidden_clock.elapsed()
+        self.timeline.setCurrentTime(min(self.duration_ms, self.timeline.currentTime() + hidden_ms))
+        self.timeline.setPaused(False)
+
+    @Slot(float, float)
+    def set_gaze(self, x: float, y: float):
+        self._store_gaze(x, y)
+        if self.gazePointBlocked:
+            return
 
-                # Update previous + current to avoid trails
-                if self._last_gaze_rect is not None:
-                    regions.append(self._last_gaze_rect)
-                regions.append(gaze_rect)
-                self._last_gaze_rect = gaze_rect
+        gx, gy = self.map_gaze_to_widget()
+        r = int(self.point_radius * 2.6)  # halo area
+        gaze_rect = QRect(int(gx - r), int(gy - r), int(2 * r), int(2 * r))
 
-        # One combined update call is fine; Qt merges internally.
-        for r in regions:
-            self.update(r)
+        # Update previous + current dot area only, instead of the whole page
+        if self._last_gaze_rect is not None:
+            self.update(self._last_gaze_rect)
+        self.update(gaze_rect)
+        self._last_gaze_rect = gaze_rect
 
     # ---------- caching ----------
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
+        self._update_geometry()
+        self._last_fill_px = -1
+        self.timeline.setUpdateInterval(self._tick_interval(int(self._track.width())))
+        self._chrome = QPixmap()
+        self._chrome_fg = QPixmap()
+        self._chrome_size = None
         self._scan_tile_ready = False
-        self._text_cache = QPixmap()
-        self._text_cache_key = None
 
     def _ensure_scan_tile(self):
         """Build a tiny pixmap used for scanline tiling (fast)."""
@@ -137,11 +217,11 @@ class InfoWidget(GazeWidget):
         self._scan_tile = pm
         self._scan_tile_ready = True
 
-    def _ensure_background_cache(self):
+    def _ensure_chrome(self):
         w, h = self.width(), self.height()
         if w <= 0 or h <= 0:
             return
-        if self._bg_cache_size == (w, h) and not self._bg_cache.isNull():
+        if self._chrome_size == (w, h) and not self._chrome.isNull():
             return
 
         self._ensure_scan_tile()
@@ -187,8 +267,17 @@ class InfoWidget(GazeWidget):
 
         p.end()
 
-        self._bg_cache = pm
-        self._bg_cache_size = (w, h)
+        fg = QPixmap(w, h)
+        fg.fill(Qt.transparent)
+        p = QPainter(fg)
+        p.setRenderHint(QPainter.Antialiasing, True)
+        self._paint_text(p)
+        self._paint_track(p)
+        p.end()
+
+        self._chrome = pm
+        self._chrome_fg = fg
+        self._chrome_size = (w, h)
 
     def _make_font_for_text(self) -> QFont:
         w, h = self.width(), self.height()
@@ -201,7 +290,7 @@ class InfoWidget(GazeWidget):
         font.setLetterSpacing(QFont.PercentageSpacing, 102)
 
         # Cheap fit heuristic
-        rect = QRectF(self._text_rect())
+        rect = QRectF(self._text_rect)
         fm = QFontMetrics(font)
         approx_lines = max(1, int(fm.horizontalAdvance(self.text) / max(1.0, rect.width())) + 1)
         if approx_lines >= 5:
@@ -211,75 +300,46 @@ class InfoWidget(GazeWidget):
             font.setPointSize(max(11, int(body_size)))
         return font
 
-    def _ensure_text_cache(self):
-        w, h = self.width(), self.height()
-        if w <= 0 or h <= 0:
-            return
-
-        font = self._make_font_for_text()
-        key = (w, h, self.text, font.pointSize(), font.bold())
+    def _paint_text(self, p: QPainter):
+        tr = self._text_rect
+        st = self._static_text
+        # QStaticText only aligns horizontally; centre the wrapped block vertically by hand
+        origin = QPointF(tr.left(), tr.top() + (tr.height() - st.size().height()) / 2.0)
 
-        if self._text_cache_key == key and not self._text_cache.isNull():
-            return
-
-        tr = self._text_rect()
-        pm = QPixmap(w, h)
-        pm.fill(Qt.transparent)
-
-        p = QPainter(pm)
         p.setRenderHint(QPainter.TextAntialiasing, True)
 
         # Glow: reduced to 2 layers, fewer offset draws (fast-ish, and cached)
         glow = QColor(self.theme.neon_cyan)
         glow.setAlpha(70)
-        p.setFont(font)
+        p.setFont(self._text_font)
 
         # layer 1: small blur
         p.setPen(glow)
         for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            p.drawText(QRectF(tr).translated(dx, dy), Qt.AlignCenter | Qt.TextWordWrap, self.text)
+            p.drawStaticText(origin + QPointF(dx, dy), st)
 
         # layer 2: even smaller
         glow2 = QColor(self.theme.neon_violet)
         glow2.setAlpha(45)
         p.setPen(glow2)
         for dx, dy in ((1, 1), (-1, 1), (1, -1), (-1, -1)):
-            p.drawText(QRectF(tr).translated(dx, dy), Qt.AlignCenter | Qt.TextWordWrap, self.text)
+            p.drawStaticText(origin + QPointF(dx, dy), st)
 
         # main text
         p.setPen(self.theme.text)
-        p.drawText(QRectF(tr), Qt.AlignCenter | Qt.TextWordWrap, self.text)
+        p.drawStaticText(origin, st)
 
-        p.end()
-
-        self._text_cache = pm
-        self._text_cache_key = key
+    def _paint_track(self, p: QPainter):
+        # Track + border in one call: brush fills, pen strokes
+        p.setPen(self._border_pen)
+        p.setBrush(self._track_brush)
+        p.drawRoundedRect(self._track, self._track_radius, self._track_radius)
 
     # ---------- drawing ----------
 
     def _draw_progress(self, p: QPainter, progress: float):
-        w, h = self.width(), self.height()
-
-        bar_height = int(h * 0.050)
-        bar_margin = int(w * 0.070)
-        bar_y = h - bar_height - int(h * 0.060)
-
-        track = QRectF(bar_margin, bar_y, w - 2 * bar_margin, bar_height)
-        radius = bar_height / 2.0
-
-        # Track
-        p.setPen(Qt.NoPen)
-        p.setBrush(QBrush(self.theme.bar_track))
-        p.drawRoundedRect(track, radius, radius)
-
-        # Border
-        border = QColor(self.theme.bar_border)
-        border.setAlpha(190)
-        pen = QPen(border)
-        pen.setWidth(max(2, int(h * 0.003)))
-        p.setPen(pen)
-        p.setBrush(Qt.NoBrush)
-        p.drawRoundedRect(track, radius, radius)
+        track = self._track
+        radius = self._track_radius
 
         # Fill (simple gradient; no extra glow rects)
         fill_w = max(0.0, min(track.width(), track.width() * progress))
@@ -290,12 +350,9 @@ class InfoWidget(GazeWidget):
         pulse = self._pulse()
 
         grad = QLinearGradient(fill.left(), 0, fill.right(), 0)
-        c1 = QColor(self.theme.neon_cyan); c1.setAlpha(220)
-        c2 = QColor(self.theme.neon_pink); c2.setAlpha(200)
-        c3 = QColor(self.theme.neon_violet); c3.setAlpha(190)
-        grad.setColorAt(0.0, c1)
-        grad.setColorAt(0.55 + 0.08 * (pulse - 0.5), c2)
-        grad.setColorAt(1.0, c3)
+        grad.setColorAt(0.0, self._fill_c1)
+        grad.setColorAt(0.55 + 0.08 * (pulse - 0.5), self._fill_c2)
+        grad.setColorAt(1.0, self._fill_c3)
 
         p.setPen(Qt.NoPen)
         p.setBrush(QBrush(grad))
@@ -305,29 +362,23 @@ class InfoWidget(GazeWidget):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
 
-        # Background cache
-        self._ensure_background_cache()
-        if not self._bg_cache.isNull():
-            # Only paint the exposed region if you want; simplest: draw full cached bg
-            p.drawPixmap(0, 0, self._bg_cache)
+        # Static background in one blit
+        self._ensure_chrome()
+        if not self._chrome.isNull():
+            p.drawPixmap(0, 0, self._chrome)
 
         # Animated “nebula” reduced: just a tiny translucent overlay (fast)
-        # (Kept outside bg-cache so it can pulse without rebuilding background.)
+        # (Kept outside the chrome so it can pulse without rebuilding it.)
         pulse = self._pulse()
-        w, h = self.width(), self.height()
-        overlay = QColor(self.theme.neon_violet)
-        overlay.setAlpha(int(10 + 10 * pulse))
-        p.fillRect(self.rect(), overlay)
-
-        # Text cache (only rebuild when needed)
-        self._ensure_text_cache()
-        if not self._text_cache.isNull():
-            p.drawPixmap(0, 0, self._text_cache)
-
-        # Progress
-        elapsed = self.timer.elapsed()
-        progress = max(0.0, min(1.0, elapsed / self.duration_ms))
-        self._draw_progress(p, progress)
+        self._overlay.setAlpha(int(10 + 10 * pulse))
+        p.fillRect(self.rect(), self._overlay)
+
+        # Text + empty track stay above the overlay, untinted
+        if not self._chrome_fg.isNull():
+            p.drawPixmap(0, 0, self._chrome_fg)
+
+        # Progress fill
+        self._draw_progress(p, self._progress)
 
         # Gaze
         if not self.gazePointBlocked:
@@ -1,16 +1,24 @@
 # widgets/LikertScaleQuestionWidget.py
 from __future__ import annotations
 
-from PySide6.QtCore import QRect, QRectF, Signal
+import time
+
+from PySide6.QtCore import QRect, QRectF, QTimer, Signal
 from PySide6.QtGui import (
     QLinearGradient,
     QPen,
-    QPixmap, QFont, QFontDatabase,
+    QPixmap, QFont, QFontDatabase, QRegion,
+    QStaticText, QTextOption, QTransform,
 )
 from PySide6.QtWidgets import QApplication, QVBoxLayout
 
 from widgets.gaze_widget import *
 
+# Gaze area ids: options are their index 0..4, everything else is negative
+AREA_REST = -1
+AREA_NONE = -2
+AREA_SUBMIT = -3
+
 def _try_load_futuristic_font() -> QFont:
     preferred = ["Orbitron", "Oxanium", "Exo 2", "Rajdhani", "Space Grotesk", "Inter"]
     fams = set(QFontDatabase.families())
@@ -28,6 +36,14 @@ class LikertScaleQuestionWidget(GazeWidget):
     submitted = Signal(object)
     clicked = Signal(int, str)
 
+    REPAINT_INTERVAL_MS = 33  # gaze arrives at tracker rate; repaint at ~30 Hz
+
+    # Dwell holds while >= 70% of the recent samples stay on the target, so a
+    # brief glance off it (or jitter across a border) doesn't restart the timer
+    DWELL_RING_SIZE = 64
+    DWELL_MIN_SHARE = 0.7
+    DWELL_MIN_SAMPLES = 5
+
     def __init__(
         self,
         parent,
@@ -52,25 +68,56 @@ class LikertScaleQuestionWidget(GazeWidget):
         else:
             assert len(labels) == 5, "LikertScaleQuestionWidget requires exactly 5 labels."
             self.labels = [str(l) for l in labels]
+        self.labels_tuple = tuple(self.labels)  # hashable copy for cache keys
 
         self.selected_index: int | None = None
         self.click_index: int = 0
 
+        # Gaze/blink input is ignored while the widget is not shown
+        self._active = False
+
         # Blink state
         self.is_blinking = False
         self.blink_fired = False
-        self.blink_timer = QElapsedTimer()
+        self._blink_deadline_ns = 0
 
-        # Dwell state
-        self.dwell_timer = QElapsedTimer()
+        # Dwell state (monotonic_ns deadlines, set when the gaze enters an area)
         self.dwell_grace_ms = 700
-        self.dwell_area: str | None = None
+        # progress per ns past the grace period; thresholds are fixed per widget
+        self._inv_effective_ns = 1.0 / (max(1, self.dwell_threshold_ms - self.dwell_grace_ms) * 1_000_000)
+        self._dwell_grace_end_ns = 0
+        self._dwell_deadline_ns = 0
+        self.dwell_area: int = AREA_NONE
         self.dwell_progress: float = 0.0
+        # ring of area ids seen since the dwell started + per-area counts (index area + 3)
+        self._dwell_ring = [AREA_NONE] * self.DWELL_RING_SIZE
+        self._dwell_ring_pos = 0
+        self._dwell_ring_len = 0
+        self._dwell_counts = [0] * 8
+        self._dwell_key: tuple[int, int] = (AREA_NONE, 0)  # (area, bar px) last scheduled
 
         # Layout rects
         self.question_rect = QRect()
         self.submit_rect = QRect()
         self.option_rects: list[QRect] = [QRect() for _ in range(5)]
+        self._selection_rects: list[QRectF] = [QRectF() for _ in range(5)]
+        self._layout_key = None
+
+        # Plain-int copy of the layout for hit-testing (set in _ensure_layout)
+        self._layout_w = 0
+        self._layout_h = 0
+        self._options_w = 0
+        self._submit_top = 0
+        self._y_to_opt = b""  # option index per row of the left strip
+
+        # Dwell bar geometry per area id: full-width track and its repaint bbox
+        self._dwell_tracks: dict[int, QRect] = {}
+        self._dwell_bboxes: dict[int, QRect] = {}
+
+        # One-entry hit-test cache on a 4px grid; panel borders are inset 10px,
+        # so a cell straddling an area boundary never lands on a panel
+        self._last_gaze_cell: tuple[int, int] | None = None
+        self._last_area = AREA_NONE
 
         # Logging (unchanged)
         self.log_toggles = 0
@@ -86,17 +133,26 @@ class LikertScaleQuestionWidget(GazeWidget):
 
         # Theme + font
         self.matchTheme(theme)
+        self._build_theme_colors()
         self.base_font = _try_load_futuristic_font()
 
         # Caches
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
-
         self._scan_tile = QPixmap()
         self._scan_ready = False
 
+        # background + panels + labels + question, rebuilt on resize
         self._static_ui_cache = QPixmap()
-        self._last_gaze_rect = None
+        self._static_ui_key = None
+        self._last_gaze_rect: QRect | None = None
+
+        # Repaint throttle: dirty rects accumulate until the timer fires
+        self._pending_dirty = QRegion()
+        self._painted_gaze: tuple[int, int] | None = None
+        self._gaze_drain_pending = False
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(self.REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self._flush_update)
 
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setAutoFillBackground(False)
@@ -105,36 +161,82 @@ class LikertScaleQuestionWidget(GazeWidget):
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
         self._static_ui_cache = QPixmap()
         self._static_ui_key = None
         self._layout_key = None
         self._scan_ready = False
+        self._painted_gaze = None
+        self._last_gaze_rect = None
+        # hit-testing reads the layout, so keep it current before the next paint
+        self._ensure_layout()
+
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._active = True
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._active = False
+        # a blink or dwell in progress must not complete against a hidden page
+        self.is_blinking = False
+        self.blink_fired = False
+        self.dwell_area = AREA_NONE
+        self.dwell_progress = 0.0
+        self._clear_dwell_ring()
+        self._repaint_timer.stop()
+        self._pending_dirty = QRegion()
 
     # ------------------------------------------------------------------ gaze
 
     @Slot(float, float)
     def set_gaze(self, x: float, y: float):
-        super().set_gaze(x, y)
+        if not self._active:
+            return
+        self._store_gaze(x, y)
+        if self.activation_mode != "dwell" and self.gazePointBlocked:
+            # nothing needs widget coords until a blink asks for them
+            return
+        # Samples queued in the same event-loop turn supersede each other;
+        # only the newest one is hit-tested and painted
+        if not self._gaze_drain_pending:
+            self._gaze_drain_pending = True
+            QTimer.singleShot(0, self._drain_gaze)
+
+    def _drain_gaze(self):
+        self._gaze_drain_pending = False
+        if not self._active:
+            return
+        gx, gy = self.map_gaze_to_widget()
+        if gx is None or gy is None:
+            return
         if self.activation_mode == "dwell":
-            gx, gy = self.map_gaze_to_widget()
-            if gx is not None and gy is not None:
-                self.update_dwell(int(gx), int(gy))
+            self.update_dwell(gx, gy)
+        if not self.gazePointBlocked and self._painted_gaze != (gx, gy):
+            self._painted_gaze = (gx, gy)
+            # repaint only where the dot was and where it is now
+            r = self._gaze_rect(gx, gy)
+            if self._last_gaze_rect is not None:
+                self._schedule_update(self._last_gaze_rect)
+            self._schedule_update(r)
+            self._last_gaze_rect = r
+
+    def _gaze_rect(self, gx: int, gy: int) -> QRect:
+        R = int(self.point_radius * 2) + 2
+        return QRect(gx - R, gy - R, 2 * R + 1, 2 * R + 1)
 
     @Slot(bool)
     def set_blinking(self, blinking: bool):
-        if self.activation_mode != "blink":
+        if self.activation_mode != "blink" or not self._active:
             return
 
         if blinking and not self.is_blinking:
-            self.blink_timer.start()
+            self._blink_deadline_ns = time.monotonic_ns() + self.blink_threshold_ms * 1_000_000
             self.is_blinking = True
             self.blink_fired = False
             return
 
         if blinking and self.is_blinking:
-            if self.blink_timer.elapsed() >= self.blink_threshold_ms and not self.blink_fired:
+            if not self.blink_fired and time.monotonic_ns() >= self._blink_deadline_ns:
                 self.handle_activation_by_point()
                 self.blink_fired = True
             return
@@ -162,101 +264,154 @@ class LikertScaleQuestionWidget(GazeWidget):
         QApplication.beep()
         self.submitted.emit(self.labels[self.selected_index])
 
-    def area_for_point(self, x: int, y: int) -> str | None:
-        if self.submit_rect.contains(x, y):
-            return "submit"
-        if self.question_rect.contains(x, y):
-            return "rest"
-        for i, rect in enumerate(self.option_rects):
-            if rect.contains(x, y):
-                return f"opt{i}"
-        return None
-
-    def handle_activation_for_area(self, area: str | None):
-        if area is None or area == "rest":
-            return
-
-        if area.startswith("opt"):
-            try:
-                idx = int(area[3:])
-            except ValueError:
-                return
-            if not (0 <= idx < 5):
-                return
-            self.click_index += 1
-            self.clicked.emit(self.click_index, str(self.labels[idx]))
-            self.set_selection(idx)
+    def area_for_point(self, x: int, y: int) -> int:
+        cell = (x >> 2, y >> 2)
+        if cell == self._last_gaze_cell:
+            return self._last_area
+
+        # Options tile the left strip evenly and the right side splits once at the
+        # submit panel, so the area follows from the coordinates directly.
+        if x < 0 or y < 0 or x >= self._layout_w or y >= self._layout_h:
+            area = AREA_NONE
+        elif x >= self._options_w:
+            area = AREA_SUBMIT if y >= self._submit_top else AREA_REST
+        else:
+            area = self._y_to_opt[y]
+
+        self._last_gaze_cell = cell
+        self._last_area = area
+        return area
+
+    def handle_activation_for_area(self, area: int):
+        if area < 0:
+            if area == AREA_SUBMIT:
+                self.click_index += 1
+                self.clicked.emit(self.click_index, "submit")
+                self.activate_submit()
             return
 
-        if area == "submit":
-            self.click_index += 1
-            self.clicked.emit(self.click_index, "submit")
-            self.activate_submit()
+        self.click_index += 1
+        self.clicked.emit(self.click_index, self.labels[area])
+        self.set_selection(area)
 
     def handle_activation_by_point(self):
+        # memoized by GazeWidget: a blink reuses the mapping set_gaze already made
         x, y = self.map_gaze_to_widget()
         if x is None or y is None:
             return
-        self.handle_activation_for_area(self.area_for_point(int(x), int(y)))
+        self.handle_activation_for_area(self.area_for_point(x, y))
 
     # ------------------------------------------------------------------ dwell
 
     def update_dwell(self, x: int, y: int):
+        # Resting on the question panel while idle is the common case; nothing to do
+        if self.dwell_area == AREA_NONE and x >= self._options_w and 0 <= y < self._submit_top:
+            return
+
         area = self.area_for_point(x, y)
 
-        if area in (None, "rest"):
-            self.dwell_area = None
-            self.dwell_progress = 0.0
+        if self.dwell_area != AREA_NONE:
+            self._push_dwell_sample(area)
+            if area != self.dwell_area and self._dwell_holds():
+                area = self.dwell_area
+
+        if area == AREA_REST or area == AREA_NONE:
+            if self.dwell_area != AREA_NONE:
+                self.dwell_area = AREA_NONE
+                self.dwell_progress = 0.0
+                self._update_dwell_region()
             return
 
+        now = time.monotonic_ns()
+
         if self.dwell_area != area:
             self.dwell_area = area
             self.dwell_progress = 0.0
-            self.dwell_timer.start()
+            self._clear_dwell_ring()
+            self._push_dwell_sample(area)
+            self._restart_dwell(now)
             self._update_dwell_region()
             return
 
-        elapsed = self.dwell_timer.elapsed()
-
-        if elapsed < self.dwell_grace_ms:
+        if now < self._dwell_grace_end_ns:
             self.dwell_progress = 0.0
             self._update_dwell_region()
             return
 
-        effective = max(1, self.dwell_threshold_ms - self.dwell_grace_ms)
-        self.dwell_progress = max(0.0, min(1.0, (elapsed - self.dwell_grace_ms) / effective))
+        # past the grace end, so only the upper bound needs clamping
+        progress = (now - self._dwell_grace_end_ns) * self._inv_effective_ns
+        self.dwell_progress = progress if progress < 1.0 else 1.0
 
-        if elapsed >= self.dwell_threshold_ms:
+        if now >= self._dwell_deadline_ns:
             self.handle_activation_for_area(area)
-            self.dwell_timer.start()
+            self._restart_dwell(now)
             self.dwell_progress = 0.0
 
         self._update_dwell_region()
 
+    def _push_dwell_sample(self, area: int):
+        i = self._dwell_ring_pos
+        if self._dwell_ring_len == self.DWELL_RING_SIZE:
+            self._dwell_counts[self._dwell_ring[i] + 3] -= 1
+        else:
+            self._dwell_ring_len += 1
+        self._dwell_ring[i] = area
+        self._dwell_counts[area + 3] += 1
+        self._dwell_ring_pos = (i + 1) % self.DWELL_RING_SIZE
+
+    def _dwell_holds(self) -> bool:
+        n = self._dwell_ring_len
+        if n < self.DWELL_MIN_SAMPLES:
+            return True
+        return self._dwell_counts[self.dwell_area + 3] >= self.DWELL_MIN_SHARE * n
+
+    def _clear_dwell_ring(self):
+        self._dwell_ring_pos = 0
+        self._dwell_ring_len = 0
+        self._dwell_counts = [0] * 8
+
+    def _restart_dwell(self, now: int):
+        self._dwell_grace_end_ns = now + self.dwell_grace_ms * 1_000_000
+        self._dwell_deadline_ns = now + self.dwell_threshold_ms * 1_000_000
+
     def _update_dwell_region(self):
-        r = self._dwell_bar_rect_for_area(self.dwell_area)
-        if r is not None:
-            self.update(r)
+        # Only repaint when the bar moved by a whole pixel or changed area
+        key = (self.dwell_area, self._dwell_fill_px())
+        if key == self._dwell_key:
+            return
+        old = self._dwell_bar_rect_for_area(self._dwell_key[0])
+        self._dwell_key = key
+        for r in (old, self._dwell_bar_rect_for_area(self.dwell_area)):
+            if r is not None:
+                self._schedule_update(r)
+
+    def _schedule_update(self, rect: QRect):
+        self._pending_dirty += rect
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_update(self):
+        dirty, self._pending_dirty = self._pending_dirty, QRegion()
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def _area_rect(self, area: int) -> QRect | None:
+        if area >= 0:
+            return self.option_rects[area]
+        if area == AREA_SUBMIT:
+            return self.submit_rect
+        return None
 
-    def _dwell_bar_rect_for_area(self, area: str | None) -> QRect | None:
-        if self.activation_mode != "dwell" or area is None:
-            return None
-        if area == "submit":
-            rect = self.submit_rect
-        elif area.startswith("opt"):
-            try:
-                idx = int(area[3:])
-            except ValueError:
-                return None
-            if not (0 <= idx < 5):
-                return None
-            rect = self.option_rects[idx]
-        else:
-            return None
+    def _dwell_fill_px(self) -> int:
+        track = self._dwell_tracks.get(self.dwell_area)
+        if track is None or self.dwell_progress <= 0.0:
+            return 0
+        return int(max(1, track.width()) * self.dwell_progress)
 
-        bar_h = max(4, rect.height() // 16)
-        pad = 8
-        return QRect(rect.left() + pad, rect.bottom() - bar_h - pad + 1, rect.width() - 2 * pad, bar_h + 2)
+    def _dwell_bar_rect_for_area(self, area: int) -> QRect | None:
+        if self.activation_mode != "dwell":
+            return None
+        return self._dwell_bboxes.get(area)
 
     # ------------------------------------------------------------------ layout + caches
 
@@ -280,6 +435,30 @@ class LikertScaleQuestionWidget(GazeWidget):
             y = i * opt_h
             height = h - y if i == 4 else opt_h
             self.option_rects[i] = QRect(0, y, options_w, height)
+            self._selection_rects[i] = QRectF(self.option_rects[i].adjusted(10, 10, -10, -10))
+
+        self._layout_w, self._layout_h = w, h
+        self._options_w = options_w
+        self._submit_top = question_h
+        self._y_to_opt = bytes(min(4, y // max(1, opt_h)) for y in range(h))
+
+        # Fonts depend only on height; build them here rather than per paint
+        self._font_big = self._base_font_for(h)
+        self._font_opt = QFont(self._font_big)
+        self._font_opt.setPointSize(max(11, int(h * 0.030)))
+        self._font_q = QFont(self._font_big)
+        self._font_q.setPointSize(max(12, int(h * 0.030)))
+
+        self._dwell_tracks.clear()
+        self._dwell_bboxes.clear()
+        for area in (0, 1, 2, 3, 4, AREA_SUBMIT):
+            outer = self._area_rect(area).adjusted(10, 10, -10, -10)
+            pad = 14
+            bar_h = max(4, outer.height() // 16)
+            track = QRect(outer.left() + pad, outer.bottom() - bar_h - pad + 1, outer.width() - 2 * pad, bar_h)
+            self._dwell_tracks[area] = track
+            self._dwell_bboxes[area] = track.adjusted(-2, -2, 2, 2)  # antialiasing
+        self._last_gaze_cell = None
 
         self._layout_key = key
 
@@ -287,6 +466,30 @@ class LikertScaleQuestionWidget(GazeWidget):
         self._static_ui_cache = QPixmap()
         self._static_ui_key = None
 
+    def _build_theme_colors(self):
+        # Selection tint per option: negative end pink, midpoint violet, positive end cyan
+        self._selection_fills: list[QColor] = []
+        self._selection_pens: list[QPen] = []
+        for i in range(5):
+            if i <= 1:
+                fill = QColor(self.theme.neon_pink)
+            elif i == 2:
+                fill = QColor(self.theme.neon_violet)
+            else:
+                fill = QColor(self.theme.neon_cyan)
+            fill.setAlpha(35)
+            border = QColor(fill)
+            border.setAlpha(190)
+            pen = QPen(border)
+            pen.setWidth(3)
+            self._selection_fills.append(fill)
+            self._selection_pens.append(pen)
+
+        self._dwell_submit_color = QColor(self.theme.submit)
+        self._dwell_submit_color.setAlpha(220)
+        self._dwell_option_color = QColor(self.theme.neon_cyan)
+        self._dwell_option_color.setAlpha(220)
+
     def _ensure_scan_tile(self):
         if self._scan_ready:
             return
@@ -300,27 +503,15 @@ class LikertScaleQuestionWidget(GazeWidget):
         self._scan_tile = pm
         self._scan_ready = True
 
-    def _ensure_background(self):
-        w, h = self.width(), self.height()
-        if self._bg_cache_size == (w, h) and not self._bg_cache.isNull():
-            return
-
+    def _paint_background(self, p: QPainter, w: int, h: int):
         self._ensure_scan_tile()
 
-        pm = QPixmap(w, h)
-        pm.fill(Qt.black)
-        p = QPainter(pm)
-
         grad = QLinearGradient(0, 0, 0, h)
         grad.setColorAt(0.0, self.theme.bg0)
         grad.setColorAt(1.0, self.theme.bg1)
-        p.fillRect(pm.rect(), grad)
+        p.fillRect(QRect(0, 0, w, h), grad)
 
         p.drawTiledPixmap(0, 0, w, h, self._scan_tile)
-        p.end()
-
-        self._bg_cache = pm
-        self._bg_cache_size = (w, h)
 
     def _base_font_for(self, h: int) -> QFont:
         f = QFont(self.base_font)
@@ -332,17 +523,18 @@ class LikertScaleQuestionWidget(GazeWidget):
 
     def _ensure_static_ui_cache(self):
         self._ensure_layout()
-        w, h = self.width(), self.height()
-
-        font = self._base_font_for(h)
-        key = (w, h, self.question, tuple(self.labels), font.pointSize())
+        key = (self._layout_key, self.question, self.labels_tuple)
 
         if self._static_ui_key == key and not self._static_ui_cache.isNull():
             return
 
+        w, h = self._layout_w, self._layout_h
+        font = self._font_big
+
         pm = QPixmap(w, h)
-        pm.fill(Qt.transparent)
+        pm.fill(Qt.black)
         p = QPainter(pm)
+        self._paint_background(p, w, h)
         p.setRenderHint(QPainter.Antialiasing, True)
         p.setRenderHint(QPainter.TextAntialiasing, True)
 
@@ -367,12 +559,8 @@ class LikertScaleQuestionWidget(GazeWidget):
                 p.setFont(title_font or font)
                 p.drawText(outer, Qt.AlignCenter, title)
 
-        opt_font = QFont(font)
-        opt_font.setBold(True)
-        opt_font.setPointSize(max(11, int(h * 0.030)))
-
         for i, rect in enumerate(self.option_rects):
-            draw_panel(rect, self.theme.neon_violet, title=str(self.labels[i]), title_font=opt_font)
+            draw_panel(rect, self.theme.neon_violet, title=self.labels[i], title_font=self._font_opt)
 
         draw_panel(self.question_rect, self.theme.neon_cyan, title=None)
         draw_panel(self.submit_rect, self.theme.submit, title="SUBMIT ⏎", title_font=font)
@@ -380,19 +568,28 @@ class LikertScaleQuestionWidget(GazeWidget):
         q_outer = self.question_rect.adjusted(10, 10, -10, -10)
         q_inner = q_outer.adjusted(18, 18, -18, -18)
 
-        q_font = QFont(font)
-        q_font.setBold(True)
-        q_font.setPointSize(max(12, int(h * 0.030)))
+        q_font = self._font_q
         p.setFont(q_font)
 
+        # Wrap the question once and stamp the layout 5x (glow + main)
+        opt = QTextOption(Qt.AlignHCenter)
+        opt.setWrapMode(QTextOption.WordWrap)
+        st = QStaticText(self.question)
+        st.setTextFormat(Qt.PlainText)
+        st.setTextOption(opt)
+        st.setTextWidth(q_inner.width())
+        st.prepare(QTransform(), q_font)
+        # QStaticText only aligns horizontally; centre the wrapped block vertically by hand
+        origin = QPointF(q_inner.left(), q_inner.top() + (q_inner.height() - st.size().height()) / 2.0)
+
         glow = QColor(self.theme.neon_cyan)
         glow.setAlpha(60)
         p.setPen(glow)
         for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            p.drawText(QRectF(q_inner).translated(dx, dy), Qt.AlignCenter | Qt.TextWordWrap, self.question)
+            p.drawStaticText(origin + QPointF(dx, dy), st)
 
         p.setPen(self.theme.text)
-        p.drawText(QRectF(q_inner), Qt.AlignCenter | Qt.TextWordWrap, self.question)
+        p.drawStaticText(origin, st)
 
         p.end()
         self._static_ui_cache = pm
@@ -404,78 +601,63 @@ class LikertScaleQuestionWidget(GazeWidget):
         if self.selected_index is None:
             return
 
-        rect = self.option_rects[self.selected_index].adjusted(10, 10, -10, -10)
+        i = self.selected_index
+        rect = self._selection_rects[i]
         # subtle neon fill + thicker border
-        fill = QColor(self.theme.neon_pink if self.selected_index <= 1 else self.theme.neon_cyan)
-        if self.selected_index == 2:
-            fill = QColor(self.theme.neon_violet)
-        if self.selected_index >= 3:
-            fill = QColor(self.theme.neon_cyan)
-        fill.setAlpha(35)
         p.setPen(Qt.NoPen)
-        p.setBrush(fill)
-        p.drawRoundedRect(QRectF(rect), 14, 14)
-
-        border = QColor(fill)
-        border.setAlpha(190)
-        pen = QPen(border)
-        pen.setWidth(3)
-        p.setPen(pen)
+        p.setBrush(self._selection_fills[i])
+        p.drawRoundedRect(rect, 14, 14)
+
+        p.setPen(self._selection_pens[i])
         p.setBrush(Qt.NoBrush)
-        p.drawRoundedRect(QRectF(rect), 14, 14)
+        p.drawRoundedRect(rect, 14, 14)
 
     def _draw_dwell_bar(self, p: QPainter):
         if self.activation_mode != "dwell":
             return
-        if self.dwell_area is None or self.dwell_progress <= 0.0:
+        if self.dwell_area == AREA_NONE or self.dwell_progress <= 0.0:
             return
 
-        if self.dwell_area == "submit":
-            rect = self.submit_rect
-            accent = self.theme.submit
-        elif self.dwell_area.startswith("opt"):
-            try:
-                idx = int(self.dwell_area[3:])
-            except ValueError:
-                return
-            if not (0 <= idx < 5):
-                return
-            rect = self.option_rects[idx]
-            accent = self.theme.neon_cyan
-        else:
+        track = self._dwell_tracks.get(self.dwell_area)
+        if track is None:
             return
+        color = self._dwell_submit_color if self.dwell_area == AREA_SUBMIT else self._dwell_option_color
 
-        outer = rect.adjusted(10, 10, -10, -10)
-        pad = 14
-        bar_h = max(4, outer.height() // 16)
-        full_w = max(1, outer.width() - 2 * pad)
-        fill_w = int(full_w * self.dwell_progress)
+        bar_h = track.height()
+        bar = QRect(track.left(), track.top(), self._dwell_fill_px(), bar_h)
 
-        bar = QRect(outer.left() + pad, outer.bottom() - bar_h - pad + 1, fill_w, bar_h)
-
-        c = QColor(accent)
-        c.setAlpha(220)
         p.setPen(Qt.NoPen)
-        p.setBrush(c)
+        p.setBrush(color)
         p.drawRoundedRect(QRectF(bar), bar_h / 2.0, bar_h / 2.0)
 
     # ------------------------------------------------------------------ paint
 
     def paintEvent(self, event):
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing, True)
+        # Qt already clips to the region; test against it (not its bounding rect) so a
+        # gaze-dot + dwell-bar update doesn't drag in everything between them
+        region = event.region()
+        dirty = event.rect()
 
-        self._ensure_layout()
-        self._ensure_background()
         self._ensure_static_ui_cache()
-
-        if not self._bg_cache.isNull():
-            p.drawPixmap(0, 0, self._bg_cache)
         if not self._static_ui_cache.isNull():
-            p.drawPixmap(0, 0, self._static_ui_cache)
-
-        self._draw_selection_overlay(p)
-        self._draw_dwell_bar(p)
-
-        if not self.gazePointBlocked:
+            p.drawPixmap(dirty, self._static_ui_cache, dirty)
+
+        # Most paints only cover the gaze dot or a dwell bar; skip what is outside
+        bar = self._dwell_bar_rect_for_area(self.dwell_area)
+        draw_sel = self.selected_index is not None and region.intersects(self.option_rects[self.selected_index])
+        draw_bar = bar is not None and region.intersects(bar)
+
+        # The blit needs no antialiasing; only the rounded overlays (and the gaze dot,
+        # which turns it on itself) do
+        if draw_sel or draw_bar:
+            p.setRenderHint(QPainter.Antialiasing, True)
+        if draw_sel:
+            self._draw_selection_overlay(p)
+        if draw_bar:
+            self._draw_dwell_bar(p)
+
+        if not self.gazePointBlocked and (
+            self._last_gaze_rect is None or region.intersects(self._last_gaze_rect)
+        ):
             self._draw_gaze(p)
@@ -2,18 +2,30 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from enum import IntEnum
 
-from PySide6.QtCore import QRect, QRectF, Signal
+from PySide6.QtCore import QRect, QRectF, QTimer, Signal
 from PySide6.QtGui import (
-    QLinearGradient,
+    QBrush, QLinearGradient,
     QPen,
-    QPixmap, QFont, QFontDatabase,
+    QPixmap, QFont, QFontDatabase, QRegion,
+    QStaticText, QTextOption, QTransform,
 )
 from PySide6.QtWidgets import QApplication
 
 from widgets.gaze_widget import *
 
 
+class Area(IntEnum):
+    OPT0 = 0
+    OPT1 = 1
+    OPT2 = 2
+    OPT3 = 3
+    RESET = 4
+    REST = 5
+    SUBMIT = 6
+
+
 def _try_load_futuristic_font() -> QFont:
     preferred = ["Orbitron", "Oxanium", "Exo 2", "Rajdhani", "Space Grotesk", "Inter"]
     fams = set(QFontDatabase.families())
@@ -32,6 +44,8 @@ class MultipleChoiceQuestionWidget(GazeWidget):
     submitted = Signal(object)
     clicked = Signal(int, str)
 
+    GAZE_INTERVAL_MS = 30  # tracker samples are coalesced to ~33 Hz
+
     def __init__(
         self,
         question: str,
@@ -63,13 +77,18 @@ class MultipleChoiceQuestionWidget(GazeWidget):
 
         # Blink
         self.is_blinking = False
-        self.blink_fired = False
-        self.blink_timer = QElapsedTimer()
+        # armed when a blink starts, stopped if it ends before the threshold
+        self._blink_timer = QTimer(self)
+        self._blink_timer.setSingleShot(True)
+        self._blink_timer.setInterval(self.blink_threshold_ms)
+        self._blink_timer.timeout.connect(self._fire_blink)
 
         # Dwell
         self.dwell_timer = QElapsedTimer()
         self.dwell_grace_ms = 700
-        self.dwell_area: str | None = None
+        # progress per ms past the grace period; thresholds are fixed per widget
+        self._inv_effective_ms = 1.0 / max(1, self.dwell_threshold_ms - self.dwell_grace_ms)
+        self.dwell_area: Area | None = None
         self.dwell_progress: float = 0.0
 
         # Layout
@@ -79,6 +98,15 @@ class MultipleChoiceQuestionWidget(GazeWidget):
         self.rect_submit = QRect()
         self._layout_key = None
 
+        # Hit boxes as plain ints (left, top, right, bottom, area), scan order as before
+        self._hit_boxes: tuple[tuple[int, int, int, int, Area], ...] = ()
+        # Gaze is temporally coherent: test the last matched box first
+        self._last_box: tuple[int, int, int, int, Area] | None = None
+        # Spatial memo on an 8px grid, only for points inside the widget, so it
+        # holds at most (w/8)*(h/8) cells; cleared on relayout.
+        # Panels are inset 10px, so a cell straddling two areas only covers gutter.
+        self._area_cache: dict[tuple[int, int], Area | None] = {}
+
         # Logging (unchanged)
         self.log_toggles = 0
         self.log_resets = 0
@@ -92,41 +120,69 @@ class MultipleChoiceQuestionWidget(GazeWidget):
 
         # Theme + font
         self.matchTheme(theme)
+        self._build_theme_brushes()
         self.base_font = _try_load_futuristic_font()
 
         # Caches
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
-
         self._scan_tile = QPixmap()
         self._scan_ready = False
 
-        self._static_ui_cache = QPixmap()  # panels + labels + question (non-animated)
+        self._static_ui_cache = QPixmap()  # background + panels + labels + question (non-animated)
         self._static_ui_key = None
 
+        self._last_gaze_rect: QRect | None = None  # where the gaze dot was last drawn
+        self._bar_tracks: dict[Area, QRect] = {}  # full-width dwell bar per activatable area
+
+        # Pre-rendered "selected" overlay per option, blitted instead of re-rasterized
+        self._selected_pms: list[QPixmap] | None = None
+
+        # Only the newest sample per interval is hit-tested and painted
+        self._gaze_timer = QTimer(self)
+        self._gaze_timer.setSingleShot(True)
+        self._gaze_timer.setInterval(self.GAZE_INTERVAL_MS)
+        self._gaze_timer.timeout.connect(self._flush_gaze)
+
+        # The static pixmap covers every pixel, so Qt needn't erase first
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setAutoFillBackground(False)
 
     # ------------------------------------------------------------------ Qt
 
     def resizeEvent(self, e):
         super().resizeEvent(e)
-        self._bg_cache = QPixmap()
-        self._bg_cache_size = None
         self._scan_ready = False
         self._static_ui_cache = QPixmap()
         self._static_ui_key = None
         self._layout_key = None
+        self._last_gaze_rect = None
+        # geometry only changes here, so hit-testing and paint can just read it
+        self._ensure_layout()
 
     # ------------------------------------------------------------------ gaze/blink
 
     @Slot(float, float)
     def set_gaze(self, x: float, y: float):
-        super().set_gaze(x, y)
+        self._store_gaze(x, y)
+        if not self._gaze_timer.isActive():
+            self._gaze_timer.start()
+
+    def _flush_gaze(self):
         if self.activation_mode == "dwell":
             gx, gy = self.map_gaze_to_widget()
             if gx is not None and gy is not None:
-                self.update_dwell(int(gx), int(gy))
+                self.update_dwell(gx, gy)
+
+        if self.gazePointBlocked:
+            return
+        # repaint only where the dot was and where it is now
+        r = self._gaze_rect()
+        if r != self._last_gaze_rect:
+            if self._last_gaze_rect is not None:
+                self.update(self._last_gaze_rect)
+            if r is not None:
+                self.update(r)
+            self._last_gaze_rect = r
 
     @Slot(bool)
     def set_blinking(self, blinking: bool):
@@ -134,20 +190,16 @@ class MultipleChoiceQuestionWidget(GazeWidget):
             return
 
         if blinking and not self.is_blinking:
-            self.blink_timer.start()
+            self._blink_timer.start()
             self.is_blinking = True
-            self.blink_fired = False
-            return
-
-        if blinking and self.is_blinking:
-            if self.blink_timer.elapsed() >= self.blink_threshold_ms and not self.blink_fired:
-                self.handle_activation_by_point()
-                self.blink_fired = True
             return
 
         if not blinking and self.is_blinking:
+            self._blink_timer.stop()
             self.is_blinking = False
-            self.blink_fired = False
+
+    def _fire_blink(self):
+        self.handle_activation_by_point()
 
     # ------------------------------------------------------------------ selection
 
@@ -180,41 +232,48 @@ class MultipleChoiceQuestionWidget(GazeWidget):
 
     # ------------------------------------------------------------------ areas
 
-    def area_for_point(self, x: int, y: int) -> str | None:
-        for i, rect in enumerate(self.option_rects):
-            if rect.contains(x, y):
-                return f"opt{i}"
-        if self.rect_reset.contains(x, y):
-            return "reset"
-        if self.rect_submit.contains(x, y):
-            return "submit"
-        if self.rect_rest.contains(x, y):
-            return "rest"
-        return None
-
-    def handle_activation_for_area(self, area: str | None):
-        if area is None or area == "rest":
+    def area_for_point(self, x: int, y: int) -> Area | None:
+        # the panels tile the widget, so off-widget samples (which trackers
+        # do report) hit nothing and must not grow the memo
+        if not (0 <= x < self.width() and 0 <= y < self.height()):
+            return None
+
+        cell = (x >> 3, y >> 3)
+        try:
+            return self._area_cache[cell]
+        except KeyError:
+            pass
+
+        box = self._last_box
+        if box is None or not (box[0] <= x < box[2] and box[1] <= y < box[3]):
+            for box in self._hit_boxes:
+                if box[0] <= x < box[2] and box[1] <= y < box[3]:
+                    break
+            else:
+                box = None
+            self._last_box = box
+
+        area = box[4] if box is not None else None
+        self._area_cache[cell] = area
+        return area
+
+    def handle_activation_for_area(self, area: Area | None):
+        if area is None or area == Area.REST:
             return
 
-        if area.startswith("opt"):
-            try:
-                idx = int(area[3:])
-            except ValueError:
-                return
-            if not (0 <= idx < 4):
-                return
+        if area <= Area.OPT3:
             self.click_index += 1
-            self.clicked.emit(self.click_index, str(self.labels[idx]))
-            self.toggle_option(idx)
+            self.clicked.emit(self.click_index, self.labels[area])
+            self.toggle_option(int(area))
             return
 
-        if area == "reset":
+        if area == Area.RESET:
             self.click_index += 1
             self.clicked.emit(self.click_index, "reset")
             self.reset_selection()
             return
 
-        if area == "submit":
+        if area == Area.SUBMIT:
             self.click_index += 1
             self.clicked.emit(self.click_index, "submit")
             self.activate_submit()
@@ -231,34 +290,64 @@ class MultipleChoiceQuestionWidget(GazeWidget):
     def update_dwell(self, x: int, y: int):
         area = self.area_for_point(x, y)
 
-        if area in (None, "rest"):
+        if area is None or area == Area.REST:
+            if self.dwell_area is not None:
+                self._update_dwell_bar(self.dwell_area)
             self.dwell_area = None
             self.dwell_progress = 0.0
             return
 
         if self.dwell_area != area:
+            if self.dwell_area is not None:
+                self._update_dwell_bar(self.dwell_area)
             self.dwell_area = area
             self.dwell_progress = 0.0
             self.dwell_timer.start()
-            self.update()
+            self._update_dwell_bar(area)
             return
 
         elapsed = self.dwell_timer.elapsed()
 
         if elapsed < self.dwell_grace_ms:
             self.dwell_progress = 0.0
-            self.update()
             return
 
-        effective = max(1, self.dwell_threshold_ms - self.dwell_grace_ms)
-        self.dwell_progress = max(0.0, min(1.0, (elapsed - self.dwell_grace_ms) / effective))
+        # past the grace period, so only the upper bound needs clamping
+        progress = (elapsed - self.dwell_grace_ms) * self._inv_effective_ms
+        self.dwell_progress = progress if progress < 1.0 else 1.0
 
         if elapsed >= self.dwell_threshold_ms:
             self.handle_activation_for_area(area)
             self.dwell_timer.start()
             self.dwell_progress = 0.0
 
-        self.update()
+        self._update_dwell_bar(area)
+
+    @staticmethod
+    def _bar_track(rect: QRect) -> QRect:
+        # full-width dwell bar at the bottom of a panel (panels are inset 10px)
+        outer = rect.adjusted(10, 10, -10, -10)
+        pad = 14
+        bar_h = max(4, outer.height() // 16)
+        return QRect(outer.left() + pad, outer.bottom() - bar_h - pad + 1, max(1, outer.width() - 2 * pad), bar_h)
+
+    def _update_dwell_bar(self, area: Area):
+        track = self._bar_tracks.get(area)
+        if track is not None:
+            self.update(track.adjusted(-2, -2, 2, 2))
+
+    def _build_theme_brushes(self):
+        def brush(c: QColor) -> QBrush:
+            c = QColor(c)
+            c.setAlpha(220)
+            return QBrush(c)
+
+        option = brush(self.theme.neon_cyan)
+        self._dwell_brushes: dict[Area, QBrush] = {
+            Area.OPT0: option, Area.OPT1: option, Area.OPT2: option, Area.OPT3: option,
+            Area.RESET: brush(self.theme.reset),
+            Area.SUBMIT: brush(self.theme.submit),
+        }
 
     # ------------------------------------------------------------------ caching/layout
 
@@ -275,27 +364,15 @@ class MultipleChoiceQuestionWidget(GazeWidget):
         self._scan_tile = pm
         self._scan_ready = True
 
-    def _ensure_background(self):
-        w, h = self.width(), self.height()
-        if self._bg_cache_size == (w, h) and not self._bg_cache.isNull():
-            return
-
+    def _paint_background(self, p: QPainter, w: int, h: int):
         self._ensure_scan_tile()
 
-        pm = QPixmap(w, h)
-        pm.fill(Qt.black)
-        p = QPainter(pm)
-
         grad = QLinearGradient(0, 0, 0, h)
         grad.setColorAt(0.0, self.theme.bg0)
         grad.setColorAt(1.0, self.theme.bg1)
-        p.fillRect(pm.rect(), grad)
+        p.fillRect(QRect(0, 0, w, h), grad)
 
         p.drawTiledPixmap(0, 0, w, h, self._scan_tile)
-        p.end()
-
-        self._bg_cache = pm
-        self._bg_cache_size = (w, h)
 
     def _ensure_layout(self):
         w, h = self.width(), self.height()
@@ -318,6 +395,25 @@ class MultipleChoiceQuestionWidget(GazeWidget):
         self.rect_rest = QRect(third_w, mid_y, third_w, mid_h)
         self.rect_submit = QRect(2 * third_w, mid_y, w - 2 * third_w, mid_h)
 
+        activatable = (
+            *zip((Area.OPT0, Area.OPT1, Area.OPT2, Area.OPT3), self.option_rects),
+            (Area.RESET, self.rect_reset),
+            (Area.SUBMIT, self.rect_submit),
+        )
+        self._hit_boxes = tuple(
+            (r.left(), r.top(), r.left() + r.width(), r.top() + r.height(), area)
+            for area, r in (*activatable, (Area.REST, self.rect_rest))
+        )
+        self._bar_tracks = {area: self._bar_track(r) for area, r in activatable}
+        self._last_box = None
+        self._area_cache.clear()
+        self._selected_pms = None
+
+        # Fonts depend only on height; build them here rather than per paint
+        self._font_big = self._base_font_for(h)
+        self._font_q = QFont(self._font_big)
+        self._font_q.setPointSize(max(11, int(h * 0.024)))
+
         self._layout_key = key
         self._static_ui_cache = QPixmap()
         self._static_ui_key = None
@@ -331,16 +427,17 @@ class MultipleChoiceQuestionWidget(GazeWidget):
 
     def _ensure_static_ui_cache(self):
         self._ensure_layout()
-        w, h = self.width(), self.height()
-
-        font = self._base_font_for(h)
-        key = (w, h, self.question, tuple(self.labels), font.pointSize())
+        key = (self._layout_key, self.question, tuple(self.labels))
         if self._static_ui_key == key and not self._static_ui_cache.isNull():
             return
 
+        w, h = self._layout_key
+        font = self._font_big
+
         pm = QPixmap(w, h)
-        pm.fill(Qt.transparent)
+        pm.fill(Qt.black)
         p = QPainter(pm)
+        self._paint_background(p, w, h)
         p.setRenderHint(QPainter.Antialiasing, True)
         p.setRenderHint(QPainter.TextAntialiasing, True)
 
@@ -368,11 +465,8 @@ class MultipleChoiceQuestionWidget(GazeWidget):
                 p.drawText(outer, Qt.AlignCenter | Qt.TextWordWrap, title)
 
         # option panels
-        opt_font = QFont(font)
-        opt_font.setPointSize(max(12, int(h * 0.035)))
         for i, r in enumerate(self.option_rects):
-            p.setFont(opt_font)
-            panel(r, self.theme.option_accent, str(self.labels[i]))
+            panel(r, self.theme.option_accent, self.labels[i])
 
         # reset/rest/submit panels
         panel(self.rect_reset, self.theme.reset, "↺ RESET")
@@ -383,19 +477,27 @@ class MultipleChoiceQuestionWidget(GazeWidget):
         q_outer = self.rect_rest.adjusted(10, 10, -10, -10)
         q_inner = q_outer.adjusted(14, 14, -14, -14)
 
-        q_font = QFont(font)
-        q_font.setBold(True)
-        q_font.setPointSize(max(11, int(h * 0.024)))
-        p.setFont(q_font)
+        p.setFont(self._font_q)
+
+        # Wrap the question once and stamp the layout 5x (glow + main)
+        opt = QTextOption(Qt.AlignHCenter)
+        opt.setWrapMode(QTextOption.WordWrap)
+        st = QStaticText(self.question)
+        st.setTextFormat(Qt.PlainText)
+        st.setTextOption(opt)
+        st.setTextWidth(q_inner.width())
+        st.prepare(QTransform(), self._font_q)
+        # QStaticText only aligns horizontally; centre the wrapped block vertically by hand
+        origin = QPointF(q_inner.left(), q_inner.top() + (q_inner.height() - st.size().height()) / 2.0)
 
         glow = QColor(self.theme.neon_cyan)
         glow.setAlpha(55)
         p.setPen(glow)
         for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            p.drawText(QRectF(q_inner).translated(dx, dy), Qt.AlignCenter | Qt.TextWordWrap, self.question)
+            p.drawStaticText(origin + QPointF(dx, dy), st)
 
         p.setPen(self.theme.text)
-        p.drawText(QRectF(q_inner), Qt.AlignCenter | Qt.TextWordWrap, self.question)
+        p.drawStaticText(origin, st)
 
         p.end()
         self._static_ui_cache = pm
@@ -403,78 +505,89 @@ class MultipleChoiceQuestionWidget(GazeWidget):
 
     # ------------------------------------------------------------------ drawing overlays
 
-    def _draw_selected_overlays(self, p: QPainter):
-        # fill + border only for selected options
-        for i in self.selected:
-            if not (0 <= i < 4):
-                continue
-            outer = self.option_rects[i].adjusted(10, 10, -10, -10)
+    def _ensure_selected_overlays(self):
+        if self._selected_pms is not None:
+            return
 
-            fill = QColor(self.theme.neon_violet)
-            fill.setAlpha(35)
-            p.setPen(Qt.NoPen)
-            p.setBrush(fill)
-            p.drawRoundedRect(QRectF(outer), 14, 14)
+        fill = QColor(self.theme.neon_violet)
+        fill.setAlpha(35)
+        br = QColor(self.theme.neon_violet)
+        br.setAlpha(200)
+        pen = QPen(br)
+        pen.setWidth(3)
 
-            br = QColor(self.theme.neon_violet)
-            br.setAlpha(200)
-            pen = QPen(br)
-            pen.setWidth(3)
-            p.setPen(pen)
-            p.setBrush(Qt.NoBrush)
-            p.drawRoundedRect(QRectF(outer), 14, 14)
+        pms = []
+        for rect in self.option_rects:
+            outer = rect.adjusted(10, 10, -10, -10)
+            # 2px margin so the 3px border's outer half isn't cut off
+            pm = QPixmap(outer.width() + 4, outer.height() + 4)
+            pm.fill(Qt.transparent)
+            op = QPainter(pm)
+            op.setRenderHint(QPainter.Antialiasing, True)
+            r = QRectF(2, 2, outer.width(), outer.height())
+            op.setPen(Qt.NoPen)
+            op.setBrush(fill)
+            op.drawRoundedRect(r, 14, 14)
+            op.setPen(pen)
+            op.setBrush(Qt.NoBrush)
+            op.drawRoundedRect(r, 14, 14)
+            op.end()
+            pms.append(pm)
+        self._selected_pms = pms
+
+    def _draw_selected_overlays(self, p: QPainter, region: QRegion):
+        # fill + border only for selected options inside the repainted region
+        if not self.selected:
+            return
+        self._ensure_selected_overlays()
+        for i in self.selected:
+            if not (0 <= i < 4) or not region.intersects(self.option_rects[i]):
+                continue
+            rect = self.option_rects[i]
+            p.drawPixmap(rect.left() + 8, rect.top() + 8, self._selected_pms[i])
 
-    def _draw_dwell_bar(self, p: QPainter):
+    def _draw_dwell_bar(self, p: QPainter, region: QRegion):
         if self.activation_mode != "dwell":
             return
         if self.dwell_area is None or self.dwell_progress <= 0.0:
             return
 
-        def bar_for(rect: QRect, accent: QColor):
-            outer = rect.adjusted(10, 10, -10, -10)
-            pad = 14
-            bar_h = max(4, outer.height() // 16)
-            full_w = max(1, outer.width() - 2 * pad)
-            fill_w = int(full_w * self.dwell_progress)
-            bar = QRect(outer.left() + pad, outer.bottom() - bar_h - pad + 1, fill_w, bar_h)
+        track = self._bar_tracks.get(self.dwell_area)
+        if track is None or not region.intersects(track):
+            return
+        bar_h = track.height()
+        bar = QRectF(track.left(), track.top(), int(track.width() * self.dwell_progress), bar_h)
 
-            c = QColor(accent)
-            c.setAlpha(220)
-            p.setPen(Qt.NoPen)
-            p.setBrush(c)
-            p.drawRoundedRect(QRectF(bar), bar_h / 2.0, bar_h / 2.0)
-
-        a = self.dwell_area
-        if a == "reset":
-            bar_for(self.rect_reset, self.theme.reset)
-        elif a == "submit":
-            bar_for(self.rect_submit, self.theme.submit)
-        elif a.startswith("opt"):
-            try:
-                idx = int(a[3:])
-            except ValueError:
-                return
-            if 0 <= idx < 4:
-                bar_for(self.option_rects[idx], self.theme.neon_cyan)
+        p.setPen(Qt.NoPen)
+        p.setBrush(self._dwell_brushes[self.dwell_area])
+        p.drawRoundedRect(bar, bar_h / 2.0, bar_h / 2.0)
 
     # ------------------------------------------------------------------ paint
 
+    def _gaze_rect(self) -> QRect | None:
+        gx, gy = self.map_gaze_to_widget()
+        if gx is None or gy is None:
+            return None
+        R = int(self.point_radius * 2) + 2  # halo radius + antialiasing
+        return QRect(gx - R, gy - R, 2 * R + 1, 2 * R + 1)
+
     def paintEvent(self, event):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
 
-        self._ensure_layout()
-        self._ensure_background()
-        self._ensure_static_ui_cache()
+        # Qt clips to the region already; only blit/draw what it covers
+        region = event.region()
+        dirty = event.rect()
 
-        if not self._bg_cache.isNull():
-            p.drawPixmap(0, 0, self._bg_cache)
+        self._ensure_static_ui_cache()
         if not self._static_ui_cache.isNull():
-            p.drawPixmap(0, 0, self._static_ui_cache)
+            p.drawPixmap(dirty, self._static_ui_cache, dirty)
 
         # dynamic overlays
-        self._draw_selected_overlays(p)
-        self._draw_dwell_bar(p)
+        self._draw_selected_overlays(p, region)
+        self._draw_dwell_bar(p, region)
 
         if not self.gazePointBlocked:
-            self._draw_gaze(p)
+            gaze = self._gaze_rect()
+            if gaze is not None and region.intersects(gaze):
+                self._draw_gaze(p)
@@ -5,7 +5,7 @@ from __future__ import annotations
 
 import math
 import time
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 from PySide6.QtCore import QRect, QTimer, Signal, QPoint, QRectF
@@ -15,70 +15,119 @@ from PySide6.QtGui import (
     QPolygon,
     QPixmap,
     QPainterPath, QFont, QFontDatabase,
+    QStaticText, QTextOption, QTransform,
 )
 from PySide6.QtWidgets import QApplication
 
 from widgets.gaze_widget import *
 
 
-# -------------------------- signal processing (unchanged) --------------------------
+# -------------------------- signal processing --------------------------
 
 
-def pearson_corr(a: np.ndarray, b: np.ndarray) -> float:
-    a = np.asarray(a, dtype=float)
-    b = np.asarray(b, dtype=float)
-    if a.size < 3 or b.size < 3:
-        return 0.0
-    if a.size != b.size:
-        m = min(a.size, b.size)
-        a = a[-m:]
-        b = b[-m:]
+def lagged_pearson_rows(a: np.ndarray, rows: np.ndarray, max_lag_samples: int) -> np.ndarray:
+    """Best Pearson correlation of ``a`` against each row over lags within +-max_lag_samples.
 
-    a = a - a.mean()
-    b = b - b.mean()
-    denom = float(np.linalg.norm(a) * np.linalg.norm(b))
-    if denom < 1e-9:
-        return 0.0
-    return float(np.dot(a, b) / denom)
+    Lag k pairs a[k:] with row[:-k] (a[:-k] with row[k:] for k < 0) and is
+    correlated over that overlap alone. ``rows`` must have a.size columns.
+    """
+    m = a.size
+    max_lag_samples = min(int(max(0, max_lag_samples)), m - 3)  # overlaps under 3 samples are skipped
+    if max_lag_samples < 0:
+        return np.zeros(rows.shape[0])
 
+    # Pearson is shift invariant; centering first keeps the window sums small.
+    # Samples may be stored as float32; the sums are always taken in float64.
+    a = np.subtract(a, a.mean(dtype=np.float64), dtype=np.float64)
+    rows = np.subtract(rows, rows.mean(axis=1, dtype=np.float64, keepdims=True), dtype=np.float64)
 
-def max_lagged_pearson_corr(a: np.ndarray, b: np.ndarray, max_lag_samples: int) -> float:
-    a = np.asarray(a, dtype=float)
-    b = np.asarray(b, dtype=float)
-    if a.size < 3 or b.size < 3:
-        return 0.0
+    lags = np.arange(-max_lag_samples, max_lag_samples + 1)
+    n = m - np.abs(lags)
+    lo_a = np.maximum(lags, 0)
+    lo_b = np.maximum(-lags, 0)
 
-    m = min(a.size, b.size)
-    a = a[-m:]
-    b = b[-m:]
+    # overlap sums of x and x^2 for every lag from prefix sums
+    ca = np.concatenate(([0.0], np.cumsum(a)))
+    caa = np.concatenate(([0.0], np.cumsum(a * a)))
+    zero = np.zeros((rows.shape[0], 1))
+    cb = np.concatenate((zero, np.cumsum(rows, axis=1)), axis=1)
+    cbb = np.concatenate((zero, np.cumsum(rows * rows, axis=1)), axis=1)
 
-    max_lag_samples = int(max(0, max_lag_samples))
-    if max_lag_samples == 0:
-        return pearson_corr(a, b)
+    sa = ca[lo_a + n] - ca[lo_a]
+    saa = caa[lo_a + n] - caa[lo_a]
+    sb = cb[:, lo_b + n] - cb[:, lo_b]
+    sbb = cbb[:, lo_b + n] - cbb[:, lo_b]
 
-    best: Optional[float] = None
-    for k in range(-max_lag_samples, max_lag_samples + 1):
-        if k == 0:
-            aa, bb = a, b
-        elif k > 0:
-            aa, bb = a[k:], b[:-k]
-        else:
-            kk = -k
-            aa, bb = a[:-kk], b[kk:]
-
-        if aa.size < 3 or bb.size < 3:
-            continue
-
-        c = pearson_corr(aa, bb)
-        if best is None or c > best:
-            best = c
+    # cross products for every lag and row from one zero-padded FFT correlation
+    size = m + max_lag_samples
+    xc = np.fft.irfft(np.fft.rfft(a, size) * np.conj(np.fft.rfft(rows, size, axis=1)), size, axis=1)
+    sab = xc[:, lags % size]
 
-    return float(best) if best is not None else 0.0
+    denom = np.sqrt(np.maximum(saa - sa * sa / n, 0.0) * np.maximum(sbb - sb * sb / n, 0.0))
+    ok = denom >= 1e-9
+    corr = np.zeros(denom.shape)
+    corr[ok] = ((sab - sa * sb / n) / np.where(ok, denom, 1.0))[ok]
+    return corr.max(axis=1)
 
 
-def gaussian_proximity(dist: np.ndarray, sigma: float) -> np.ndarray:
+def gaussian_proximity_sq(dist_sq: np.ndarray, sigma: float) -> np.ndarray:
+    """Gaussian proximity from squared distances, so callers can skip the sqrt."""
     sigma = max(1.0, float(sigma))
-    return np.exp(-(dist * dist) / (2.0 * sigma * sigma))
+    return np.exp(dist_sq * (-0.5 / (sigma * sigma)))
+
+
+class RingBuffer:
+    """Sliding window over parallel float series sharing one time stamp per sample.
+
+    Live samples are always the contiguous columns [head, head + count), so
+    views are plain slices: when the write position reaches the end, the live
+    window is moved back to column 0 (or the storage doubles if it is full).
+    Time stamps stay float64; the series use ``dtype``.
+    """
+
+    def __init__(self, rows: int, capacity: int, dtype=np.float32):
+        cap = max(16, 2 * capacity)
+        self._t = np.empty(cap, dtype=np.float64)
+        self._buf = np.empty((rows, cap), dtype=dtype)
+        self.head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        self.head = 0
+        self.count = 0
+
+    def append(self, t: float, values) -> None:
+        end = self.head + self.count
+        if end == self._t.size:
+            if self.head > 0:
+                self._t[:self.count] = self._t[self.head:end]
+                self._buf[:, :self.count] = self._buf[:, self.head:end]
+            else:
+                t_grown = np.empty(2 * self._t.size, dtype=np.float64)
+                t_grown[:self.count] = self._t[:self.count]
+                grown = np.empty((self._buf.shape[0], 2 * self._t.size), dtype=self._buf.dtype)
+                grown[:, :self.count] = self._buf[:, :self.count]
+                self._t, self._buf = t_grown, grown
+            self.head = 0
+            end = self.count
+        self._t[end] = t
+        self._buf[:, end] = values
+        self.count += 1
+
+    def prune_until(self, min_t: float) -> None:
+        # time stamps are monotonic, so everything older sits in front of min_t
+        drop = int(np.searchsorted(self.times(), min_t, side="left"))
+        self.head += drop
+        self.count -= drop
+
+    def times(self) -> np.ndarray:
+        return self._t[self.head:self.head + self.count]
+
+    def view(self, rows=slice(None)) -> np.ndarray:
+        return self._buf[rows, self.head:self.head + self.count]
 
 
 # -------------------------- neon theme + font helpers --------------------------
@@ -102,6 +151,16 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
     submitted = Signal(object)
     clicked = Signal(int, str)
 
+    EXPECTED_GAZE_HZ = 120  # sizes the sample window; it grows if a tracker runs faster
+
+    # rows of the sample window
+    _GX, _GY = 0, 1
+    # the five option targets are followed by the submit target, so rows
+    # _TX.._SX (and _TY.._SY) can be scored against the gaze in one batch
+    _TX, _SX = 2, 7
+    _TY, _SY = 8, 13
+    _ROWS = 14
+
     def __init__(
         self,
         question: str,
@@ -171,22 +230,19 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
 
         # rolling buffers
         self._t0 = time.monotonic()
-        self._t: List[float] = []
-        self._gx: List[float] = []
-        self._gy: List[float] = []
-        self._tx: Dict[str, List[float]] = {lab: [] for lab in self.labels}
-        self._ty: Dict[str, List[float]] = {lab: [] for lab in self.labels}
-        self._sx: List[float] = []
-        self._sy: List[float] = []
+        self._win = RingBuffer(self._ROWS, math.ceil(self.window_ms * self.EXPECTED_GAZE_HZ / 1000.0))
+        self._last_t: Optional[float] = None
+        self._dt_ema: Optional[float] = None  # smoothed sample interval, sets the lag range
 
         self.selected: Optional[str] = None
-        self._candidate: Optional[str] = None
+        self._selected_idx: Optional[int] = None  # index of self.selected in self.labels
+        self._candidate: Optional[int] = None
         self._candidate_count = 0
         self._submit_count = 0
         self._toggle_block_until = 0.0
         self._submit_block_until = 0.0
 
-        self._last_scores: Dict[str, float] = {lab: 0.0 for lab in self.labels}
+        self._last_scores = np.zeros(len(self.labels))
         self._last_submit_score: float = 0.0
 
         self.click_index: int = 0
@@ -199,6 +255,7 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
 
         # ---- neon theme + caches ----
         self.matchTheme(theme)
+        self._build_theme_pens()
         self.base_font = _try_load_futuristic_font()
 
         self._scan_tile = QPixmap()
@@ -212,9 +269,13 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self._question_rect = QRect()
         self._submit_rect = QRect()
         self._submit_ax = 0.0
-        self._centers: Dict[str, Tuple[float, float]] = {}
-        self._orbit_cfg: Dict[str, Dict[str, float]] = {}
-        self._orbit_paths: Dict[str, QPainterPath] = {}
+        # per option, in label order
+        self._centers: List[Tuple[float, float]] = []
+        self._orbit_cfg: List[Tuple[str, float, bool]] = []  # (shape, radius / half side, clockwise)
+        self._orbit_paths: List[QPainterPath] = []
+        self._label_rects: List[QRect] = []
+        self._label_texts: List[QStaticText] = []  # wrapped once per layout, stamped per frame
+        self._label_origins: List[QPointF] = []
         self._submit_line_y = 0
 
         # static UI cache (orbits, labels base, question panel)
@@ -228,14 +289,35 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         # animation
         self._anim_timer = QTimer(self)
         self._anim_timer.setInterval(16)  # keep as-is; drawing is now cheap
-        self._anim_timer.timeout.connect(self.update)
-        self._anim_timer.start()
+        self._anim_timer.timeout.connect(self._tick)  # runs only while shown
+        self._new_samples = 0  # gaze samples appended since the last decision
+        self._active = False
 
         self.setAttribute(Qt.WA_OpaquePaintEvent, True)
         self.setAutoFillBackground(False)
 
     # -------------------------- layout + caching --------------------------
 
+    def showEvent(self, e):
+        super().showEvent(e)
+        self._active = True
+        # start the pursuit from a clean window; nothing seen while hidden counts
+        self._t0 = time.monotonic()
+        self._win.clear()
+        self._last_t = None
+        self._new_samples = 0
+        self._candidate = None
+        self._candidate_count = 0
+        self._submit_count = 0
+        self._last_scores[:] = 0.0
+        self._last_submit_score = 0.0
+        self._anim_timer.start()
+
+    def hideEvent(self, e):
+        super().hideEvent(e)
+        self._active = False
+        self._anim_timer.stop()
+
     def resizeEvent(self, e):
         super().resizeEvent(e)
         self._bg_cache = QPixmap()
@@ -245,6 +327,8 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self._static_ui_key = None
         self._info_cache = QPixmap()
         self._info_cache_key = None
+        # geometry only changes here; the per-sample paths just check the key
+        self._ensure_layout_cache()
 
     def _ensure_scan_tile(self):
         if self._scan_ready:
@@ -279,7 +363,7 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self._bg_cache = pm
         self._bg_cache_size = (w, h)
 
-    def _layout(self) -> Tuple[QRect, Dict[str, Tuple[float, float]], Dict[str, Dict[str, float]], QRect, float]:
+    def _layout(self) -> Tuple[QRect, List[Tuple[float, float]], List[Tuple[str, float, bool]], QRect, float]:
         w = max(1, self.width())
         h = max(1, self.height())
 
@@ -331,21 +415,21 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         mid_y = float(h * 0.62) + shift
         mid_y = float(max(mid_y_min, min(mid_y, mid_y_max)))
 
-        centers = {
-            self.labels[0]: (left_x, mid_y),
-            self.labels[1]: (left_x, top_y),
-            self.labels[2]: (mid_x, top_y),
-            self.labels[3]: (right_x, top_y),
-            self.labels[4]: (right_x, mid_y),
-        }
-
-        orbit_params: Dict[str, Dict[str, float]] = {
-            self.labels[0]: {"type": "circle", "r": circle_r_mid, "clockwise": 0.0},
-            self.labels[1]: {"type": "square", "hs": square_half_top, "clockwise": 1.0},
-            self.labels[2]: {"type": "triangle", "r": tri_r_top, "clockwise": 1.0},
-            self.labels[3]: {"type": "circle", "r": circle_r_top, "clockwise": 0.0},
-            self.labels[4]: {"type": "square", "hs": square_half_mid, "clockwise": 1.0},
-        }
+        centers = [
+            (left_x, mid_y),
+            (left_x, top_y),
+            (mid_x, top_y),
+            (right_x, top_y),
+            (right_x, mid_y),
+        ]
+
+        orbit_params = [
+            ("circle", circle_r_mid, False),
+            ("square", square_half_top, True),
+            ("triangle", tri_r_top, True),
+            ("circle", circle_r_top, False),
+            ("square", square_half_mid, True),
+        ]
 
         return question_rect, centers, orbit_params, submit_rect, float(submit_ax)
 
@@ -363,27 +447,55 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self._submit_ax = float(submit_ax)
 
         # precompute orbit paths
-        self._orbit_paths = {}
-        for lab in self.labels:
-            cx, cy = centers[lab]
-            cfg = orbit_params[lab]
-            typ = str(cfg["type"])
+        self._orbit_paths = []
+        for (cx, cy), (typ, r, _) in zip(centers, orbit_params):
             path = QPainterPath()
             if typ == "circle":
-                r = float(cfg["r"])
                 path.addEllipse(QPoint(int(cx), int(cy)), int(r), int(r))
             elif typ == "square":
-                hs = float(cfg["hs"])
-                path.addRect(QRectF(cx - hs, cy - hs, 2 * hs, 2 * hs))
+                path.addRect(QRectF(cx - r, cy - r, 2 * r, 2 * r))
             else:
-                r = float(cfg["r"])
                 v0 = QPoint(int(cx), int(cy - r))
                 v1 = QPoint(int(cx + (math.sqrt(3) / 2.0) * r), int(cy + 0.5 * r))
                 v2 = QPoint(int(cx - (math.sqrt(3) / 2.0) * r), int(cy + 0.5 * r))
                 poly = QPolygon([v0, v1, v2])
                 path.addPolygon(poly)
                 path.closeSubpath()
-            self._orbit_paths[lab] = path
+            self._orbit_paths.append(path)
+
+        self._build_trajectories()
+        self._label_rects = [QRect(int(cx - 220), int(cy - 90), 440, 180) for cx, cy in centers]
+
+        # height-dependent paint state, built here rather than per frame
+        self._font_label = QFont(self.base_font)
+        self._font_label.setBold(True)
+        self._font_label.setPointSize(max(24, int(h * 0.038)))
+        self._font_submit = QFont(self.base_font)
+        self._font_submit.setBold(True)
+        self._font_submit.setPointSize(max(22, int(h * 0.038)))
+        # Wrap each label once; QStaticText only aligns horizontally, so the
+        # block is centred vertically in its rect by hand
+        opt = QTextOption(Qt.AlignHCenter)
+        opt.setWrapMode(QTextOption.WordWrap)
+        self._label_texts = []
+        self._label_origins = []
+        for lab, rect in zip(self.labels, self._label_rects):
+            st = QStaticText(lab)
+            st.setTextFormat(Qt.PlainText)
+            st.setTextOption(opt)
+            st.setTextWidth(rect.width())
+            st.prepare(QTransform(), self._font_label)
+            self._label_texts.append(st)
+            self._label_origins.append(QPointF(rect.left(), rect.top() + (rect.height() - st.size().height()) / 2.0))
+
+        # dot radii: option normal / highlight / selected, submit normal / hot
+        self._dot_r = (
+            max(8, int(h * 0.014)),
+            max(9, int(h * 0.016)),
+            max(10, int(h * 0.018)),
+            max(9, int(h * 0.016)),
+            max(11, int(h * 0.020)),
+        )
 
         self._submit_line_y = self._submit_rect.center().y() + int(h * 0.03)
 
@@ -393,6 +505,17 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self._info_cache = QPixmap()
         self._info_cache_key = None
 
+    def _build_theme_pens(self):
+        def pen(c: QColor, width: int) -> QPen:
+            pn = QPen(c, width)
+            pn.setCosmetic(True)
+            return pn
+
+        self._pen_label_selected = pen(self.theme.selected, 6)
+        self._pen_label_highlight = pen(self.theme.highlight, 4)
+        self._pen_submit = pen(self.theme.text, 4)
+        self._pen_submit_disabled = pen(self.theme.disabled, 3)
+
     def _ensure_static_ui_cache(self):
         self._ensure_layout_cache()
         w, h = max(1, self.width()), max(1, self.height())
@@ -417,8 +540,8 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         orbit_pen.setCosmetic(True)
         p.setPen(orbit_pen)
         p.setBrush(Qt.NoBrush)
-        for lab in self.labels:
-            p.drawPath(self._orbit_paths[lab])
+        for path in self._orbit_paths:
+            p.drawPath(path)
 
         # submit guide line (static)
         guide = QColor(self.theme.guide)
@@ -456,194 +579,166 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         p.drawText(QRectF(inner), Qt.AlignCenter | Qt.TextWordWrap, self.question)
 
         # static labels base (dim)
-        lfont = QFont(self.base_font)
-        lfont.setBold(True)
-        lfont.setPointSize(lab_pt)
-        p.setFont(lfont)
+        p.setFont(self._font_label)
         p.setPen(self.theme.text_dim)
 
-        for lab in self.labels:
-            cx, cy = self._centers[lab]
-            rect = QRect(int(cx - 220), int(cy - 90), 440, 180)
-            p.drawText(rect, Qt.AlignCenter | Qt.TextWordWrap, lab)
+        for origin, st in zip(self._label_origins, self._label_texts):
+            p.drawStaticText(origin, st)
 
         p.end()
         self._static_ui_cache = pm
         self._static_ui_key = key
 
-    # -------------------------- target motion (unchanged) --------------------------
-
-    @staticmethod
-    def _circle_pos(cx: float, cy: float, r: float, t: float, freq_hz: float, clockwise: bool) -> Tuple[float, float]:
-        omega = 2.0 * math.pi * freq_hz
-        ang = omega * t
-        s = 1.0 if clockwise else -1.0
-        return cx + r * math.cos(s * ang), cy + r * math.sin(s * ang)
-
-    @staticmethod
-    def _square_pos(cx: float, cy: float, half_side: float, t: float, freq_hz: float, clockwise: bool) -> Tuple[float, float]:
-        u = (t * freq_hz) % 1.0
-        if not clockwise:
-            u = (1.0 - u) % 1.0
-
-        p = u * 4.0
-        x0, x1 = cx - half_side, cx + half_side
-        y0, y1 = cy - half_side, cy + half_side
-
-        if 0.0 <= p < 1.0:
-            return x0 + (x1 - x0) * p, y0
-        if 1.0 <= p < 2.0:
-            q = p - 1.0
-            return x1, y0 + (y1 - y0) * q
-        if 2.0 <= p < 3.0:
-            q = p - 2.0
-            return x1 - (x1 - x0) * q, y1
-        q = p - 3.0
-        return x0, y1 - (y1 - y0) * q
-
-    @staticmethod
-    def _triangle_pos(cx: float, cy: float, r: float, t: float, freq_hz: float, clockwise: bool) -> Tuple[float, float]:
-        v0 = (cx, cy - r)
-        v1 = (cx + (math.sqrt(3) / 2.0) * r, cy + 0.5 * r)
-        v2 = (cx - (math.sqrt(3) / 2.0) * r, cy + 0.5 * r)
-        verts = [v0, v1, v2] if clockwise else [v0, v2, v1]
-
-        u = (t * freq_hz) % 1.0
-        p = u * 3.0
-
-        def lerp(a: Tuple[float, float], b: Tuple[float, float], s: float) -> Tuple[float, float]:
-            return a[0] + (b[0] - a[0]) * s, a[1] + (b[1] - a[1]) * s
-
-        if 0.0 <= p < 1.0:
-            return lerp(verts[0], verts[1], p)
-        if 1.0 <= p < 2.0:
-            return lerp(verts[1], verts[2], p - 1.0)
-        return lerp(verts[2], verts[0], p - 2.0)
-
-    def _targets_at_time(self, t: float) -> Tuple[Dict[str, Tuple[float, float]], QRect, Tuple[float, float], float]:
+    # -------------------------- target motion --------------------------
+
+    def _build_trajectories(self) -> None:
+        """Per-option arrays so _targets_at_time places all five targets at once.
+
+        Polygons are stored as closed vertex rows in travel order (padded to
+        five columns); circles only use centre, radius and direction.
+        """
+        n = len(self._centers)
+        self._traj_c = np.array(self._centers, dtype=float)
+        self._traj_r = np.array([r for _, r, _ in self._orbit_cfg], dtype=float)
+        self._traj_circle = np.array([typ == "circle" for typ, _, _ in self._orbit_cfg])
+        self._traj_sign = np.array([1.0 if cw else -1.0 for _, _, cw in self._orbit_cfg])
+        self._traj_edges = np.ones(n, dtype=int)
+        self._traj_verts = np.zeros((n, 5, 2), dtype=float)
+
+        s3 = math.sqrt(3) / 2.0
+        for i, (typ, r, cw) in enumerate(self._orbit_cfg):
+            if typ == "square":
+                verts = [(-r, -r), (r, -r), (r, r), (-r, r)]
+            elif typ == "triangle":
+                verts = [(0.0, -r), (s3 * r, 0.5 * r), (-s3 * r, 0.5 * r)]
+            else:
+                continue
+            if not cw:
+                verts = verts[:1] + verts[:0:-1]
+            self._traj_edges[i] = len(verts)
+            self._traj_verts[i, :len(verts)] = verts
+            self._traj_verts[i, len(verts):] = verts[0]
+            self._traj_verts[i] += self._traj_c[i]
+
+    def _targets_at_time(self, t: float) -> Tuple[Tuple[np.ndarray, np.ndarray], QRect, Tuple[float, float], float]:
         w = max(1, self.width())
-        self._ensure_layout_cache()
+        if self._layout_key is None:
+            self._ensure_layout_cache()
 
-        pos: Dict[str, Tuple[float, float]] = {}
-        for lab in self.labels:
-            cx, cy = self._centers[lab]
-            cfg = self._orbit_cfg[lab]
-            typ = str(cfg["type"])
-            clockwise = bool(int(cfg.get("clockwise", 1.0)))
+        phase = t * self.option_frequency_hz
 
-            if typ == "circle":
-                pos[lab] = self._circle_pos(cx, cy, float(cfg["r"]), t, self.option_frequency_hz, clockwise=clockwise)
-            elif typ == "square":
-                pos[lab] = self._square_pos(cx, cy, float(cfg["hs"]), t, self.option_frequency_hz, clockwise=clockwise)
-            else:
-                pos[lab] = self._triangle_pos(cx, cy, float(cfg["r"]), t, self.option_frequency_hz, clockwise=clockwise)
+        # circles
+        ang = (2.0 * math.pi * phase) * self._traj_sign
+        circ = self._traj_c + self._traj_r[:, None] * np.stack((np.cos(ang), np.sin(ang)), axis=1)
+
+        # polygons: lerp along the edge the phase falls on
+        p = (phase % 1.0) * self._traj_edges
+        k = np.minimum(p.astype(int), self._traj_edges - 1)
+        rows = np.arange(k.size)
+        a = self._traj_verts[rows, k]
+        b = self._traj_verts[rows, k + 1]
+        poly = a + (p - k)[:, None] * (b - a)
+
+        pos = np.where(self._traj_circle[:, None], circ, poly)
 
         omega = 2.0 * math.pi * self.submit_frequency_hz
         submit_dot_x = (w * 0.5) + self._submit_ax * math.sin(omega * t)
         submit_dot_y = float(self._submit_line_y)
 
-        return pos, self._submit_rect, (float(submit_dot_x), float(submit_dot_y)), float(self._submit_ax)
+        return (pos[:, 0], pos[:, 1]), self._submit_rect, (float(submit_dot_x), float(submit_dot_y)), float(self._submit_ax)
 
-    # -------------------------- decision logic (unchanged) --------------------------
+    # -------------------------- decision logic --------------------------
 
     def _estimate_max_lag_samples(self) -> int:
-        if len(self._t) >= 6:
-            dt = float(np.median(np.diff(np.asarray(self._t, dtype=float))))
-            if dt <= 1e-6:
-                dt = 1.0 / 30.0
-        else:
-            dt = 1.0 / 30.0
+        dt = self._dt_ema if self._dt_ema is not None else 1.0 / 30.0
         return int(round(max(0.0, self.max_lag_ms / 1000.0) / dt))
 
+    def _track_sample_interval(self, t: float) -> None:
+        # the tracker rate drifts slowly, so an EMA stands in for the median interval;
+        # gaps longer than the window (tracking lost) are not intervals
+        if self._last_t is not None:
+            dt = t - self._last_t
+            if 1e-6 < dt < self.window_ms / 1000.0:
+                self._dt_ema = dt if self._dt_ema is None else self._dt_ema + 0.1 * (dt - self._dt_ema)
+        self._last_t = t
+
     def _prune_window(self) -> None:
-        if not self._t:
+        if not self._win:
             return
-        newest = self._t[-1]
-        min_t = newest - (self.window_ms / 1000.0)
-
-        while self._t and self._t[0] < min_t:
-            self._t.pop(0)
-            self._gx.pop(0)
-            self._gy.pop(0)
-            for lab in self.labels:
-                self._tx[lab].pop(0)
-                self._ty[lab].pop(0)
-            self._sx.pop(0)
-            self._sy.pop(0)
+        newest = float(self._win.times()[-1])
+        self._win.prune_until(newest - (self.window_ms / 1000.0))
 
     def _now(self) -> float:
         return time.monotonic()
 
     @Slot(float, float)
     def set_gaze(self, x: float, y: float):
-        super().set_gaze(x, y)
+        if not self._active:
+            return
+        # only ingest here; _tick repaints and decides at most once per frame
+        self._store_gaze(x, y)
 
         gx, gy = self.map_gaze_to_widget()
         if gx is None or gy is None:
             self._candidate = None
             self._candidate_count = 0
             self._submit_count = 0
+            self._new_samples = 0
             return
 
         t = time.monotonic() - self._t0
-        opt_pos, _, submit_dot, _ = self._targets_at_time(t)
+        self._track_sample_interval(t)
+        (px, py), _, submit_dot, _ = self._targets_at_time(t)
         sx, sy = submit_dot
 
-        self._t.append(float(t))
-        self._gx.append(float(gx))
-        self._gy.append(float(gy))
-        for lab in self.labels:
-            tx, ty = opt_pos[lab]
-            self._tx[lab].append(float(tx))
-            self._ty[lab].append(float(ty))
-        self._sx.append(float(sx))
-        self._sy.append(float(sy))
+        self._win.append(t, (
+            gx, gy,
+            *px, sx,
+            *py, sy,
+        ))
 
         self._prune_window()
-        if len(self._t) < 12:
-            return
-
-        self._update_decision()
-
-    def _option_score(self, lab: str) -> float:
-        gx = np.asarray(self._gx, dtype=float)
-        gy = np.asarray(self._gy, dtype=float)
-        tx = np.asarray(self._tx[lab], dtype=float)
-        ty = np.asarray(self._ty[lab], dtype=float)
-
-        if self.use_lag_compensation:
-            max_lag_samples = self._estimate_max_lag_samples()
-            cx = max_lagged_pearson_corr(gx, tx, max_lag_samples)
-            cy = max_lagged_pearson_corr(gy, ty, max_lag_samples)
-        else:
-            cx = pearson_corr(gx, tx)
-            cy = pearson_corr(gy, ty)
-
-        corr = 0.5 * (cx + cy)
-        dist = np.sqrt((gx - tx) ** 2 + (gy - ty) ** 2)
-        prox = float(np.mean(gaussian_proximity(dist, self.proximity_sigma_px)))
+        if len(self._win) >= 12:
+            self._new_samples += 1
+
+    def _tick(self):
+        self.update()
+        if self._new_samples:
+            self._update_decision()
+
+    def _scores(self) -> np.ndarray:
+        """Scores of the five options followed by the submit target.
+
+        Options that cannot reach corr_threshold even with a perfect
+        correlation skip the lag sweep and keep only their proximity term;
+        they can neither become the candidate nor be highlighted.
+        """
+        gx = self._win.view(self._GX)
+        gy = self._win.view(self._GY)
+        tx = self._win.view(slice(self._TX, self._SX + 1))
+        ty = self._win.view(slice(self._TY, self._SY + 1))
+
+        dx = gx - tx
+        dy = gy - ty
+        prox = gaussian_proximity_sq(dx * dx + dy * dy, self.proximity_sigma_px).mean(axis=1)
         prox_mapped = (2.0 * prox) - 1.0
-        return float((self.corr_weight * corr) + (self.proximity_weight * prox_mapped))
 
-    def _submit_score(self) -> float:
-        gx = np.asarray(self._gx, dtype=float)
-        gy = np.asarray(self._gy, dtype=float)
-        sx = np.asarray(self._sx, dtype=float)
-        sy = np.asarray(self._sy, dtype=float)
+        reachable = np.flatnonzero(self.corr_weight + self.proximity_weight * prox_mapped[:5] >= self.corr_threshold)
+        rows = np.append(reachable, 5)  # submit is always scored
 
-        if self.use_lag_compensation:
-            max_lag_samples = self._estimate_max_lag_samples()
-            corr = max_lagged_pearson_corr(gx, sx, max_lag_samples)
-        else:
-            corr = pearson_corr(gx, sx)
+        max_lag_samples = self._estimate_max_lag_samples() if self.use_lag_compensation else 0
+        corr = np.zeros(6)
+        corr[rows] = lagged_pearson_rows(gx, tx[rows], max_lag_samples)
+        # options follow both axes; the submit dot only moves horizontally
+        if reachable.size:
+            corr[reachable] = 0.5 * (corr[reachable] + lagged_pearson_rows(gy, ty[reachable], max_lag_samples))
 
-        dist = np.sqrt((gx - sx) ** 2 + (gy - sy) ** 2)
-        prox = float(np.mean(gaussian_proximity(dist, self.proximity_sigma_px)))
-        prox_mapped = (2.0 * prox) - 1.0
-        return float((self.corr_weight * corr) + (self.proximity_weight * prox_mapped))
+        return (self.corr_weight * corr) + (self.proximity_weight * prox_mapped)
 
-    def _select(self, lab: str) -> None:
-        if self.selected != lab:
+    def _select(self, idx: int) -> None:
+        lab = self.labels[idx]
+        if self._selected_idx != idx:
+            self._selected_idx = idx
             self.selected = lab
             self.log_toggles += 1
 
@@ -663,33 +758,39 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         self.submitted.emit(self.selected if self.selected is not None else "")
 
     def _update_decision(self) -> None:
+        """Score the window once for every sample that arrived since the last tick.
+
+        Stability counters advance by the number of new samples, so
+        toggle/submit_stable_samples keep meaning gaze samples.
+        """
+        if len(self._win) < 12:
+            self._new_samples = 0
+            return
+
         now = self._now()
+        new = self._new_samples
+        self._new_samples = 0
 
-        best_lab: Optional[str] = None
-        best_score = -999.0
-        for lab in self.labels:
-            s = self._option_score(lab)
-            self._last_scores[lab] = s
-            if s > best_score:
-                best_score = s
-                best_lab = lab
+        scores = self._scores()
+        self._last_scores = scores[:5]
+        best = int(np.argmax(self._last_scores))
 
-        option_candidate = best_lab if (best_lab is not None and best_score >= self.corr_threshold) else None
+        option_candidate = best if self._last_scores[best] >= self.corr_threshold else None
 
         if option_candidate is None:
             self._candidate = None
             self._candidate_count = 0
         else:
             if option_candidate == self._candidate:
-                self._candidate_count += 1
+                self._candidate_count += new
             else:
                 self._candidate = option_candidate
-                self._candidate_count = 1
+                self._candidate_count = new
 
-        ss = self._submit_score()
+        ss = float(scores[5])
         self._last_submit_score = ss
         if ss >= self.submit_corr_threshold:
-            self._submit_count += 1
+            self._submit_count += new
         else:
             self._submit_count = 0
 
@@ -701,10 +802,10 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
             return
 
         if now >= self._toggle_block_until and self._candidate is not None and self._candidate_count >= self.toggle_stable_samples:
-            lab = self._candidate
+            idx = self._candidate
             self._candidate = None
             self._candidate_count = 0
-            self._select(lab)
+            self._select(idx)
 
     # -------------------------- paint (fast) --------------------------
 
@@ -712,7 +813,6 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
 
-        w, h = max(1, self.width()), max(1, self.height())
         self._ensure_background()
         self._ensure_layout_cache()
         self._ensure_static_ui_cache()
@@ -723,85 +823,59 @@ class SmoothPursuitLikertScaleWidget(GazeWidget):
         p.drawPixmap(0, 0, self._info_cache)
 
         # current highlight option (candidate)
-        highlight_opt: Optional[str] = None
-        if self._last_scores:
-            best = max(self._last_scores, key=self._last_scores.get)
-            if self._last_scores.get(best, 0.0) >= self.corr_threshold:
-                highlight_opt = best
+        highlight_opt: Optional[int] = None
+        best = int(np.argmax(self._last_scores))
+        if self._last_scores[best] >= self.corr_threshold:
+            highlight_opt = best
 
         sel_txt = self.selected if self.selected is not None else "-"
 
         # moving targets
         t = time.monotonic() - self._t0
-        opt_pos, submit_rect, submit_dot, _ = self._targets_at_time(t)
+        (px, py), submit_rect, submit_dot, _ = self._targets_at_time(t)
 
         # overlay selected/highlight label styling (draw only for at most 2 labels)
-        lab_font = QFont(self.base_font)
-        lab_font.setBold(True)
-        lab_font.setPointSize(max(24, int(h * 0.038)))
-        p.setFont(lab_font)
-
-        def draw_label_overlay(lab: str, mode: str):
-            cx, cy = self._centers[lab]
-            rect = QRect(int(cx - 220), int(cy - 90), 440, 180)
-            if mode == "selected":
-                pen = QPen(self.theme.selected, 6)
-            else:
-                pen = QPen(self.theme.highlight, 4)
-            pen.setCosmetic(True)
-            p.setPen(pen)
-            p.drawText(rect, Qt.AlignCenter | Qt.TextWordWrap, lab)
-
+        p.setFont(self._font_label)
         if highlight_opt is not None:
-            draw_label_overlay(highlight_opt, "highlight")
-        if self.selected is not None:
-            draw_label_overlay(self.selected, "selected")
+            p.setPen(self._pen_label_highlight)
+            p.drawStaticText(self._label_origins[highlight_opt], self._label_texts[highlight_opt])
+        if self._selected_idx is not None:
+            p.setPen(self._pen_label_selected)
+            p.drawStaticText(self._label_origins[self._selected_idx], self._label_texts[self._selected_idx])
 
         # draw option dots
         p.setPen(Qt.NoPen)
-        for lab in self.labels:
-            x, y = opt_pos[lab]
-            selected = (lab == self.selected)
-            highlight = (lab == highlight_opt)
+        r_normal, r_highlight, r_selected, r_submit, r_submit_hot = self._dot_r
+        for i, (x, y) in enumerate(zip(px.tolist(), py.tolist())):
+            selected = (i == self._selected_idx)
+            highlight = (i == highlight_opt)
 
             if selected:
                 p.setBrush(self.theme.selected)
-                r = max(10, int(h * 0.018))
+                r = r_selected
             elif highlight:
                 p.setBrush(self.theme.dot)
-                r = max(9, int(h * 0.016))
+                r = r_highlight
             else:
                 p.setBrush(self.theme.dot)
-                r = max(8, int(h * 0.014))
+                r = r_normal
 
             p.drawEllipse(int(x) - r, int(y) - r, 2 * r, 2 * r)
 
         # submit UI (dynamic text + dot)
         enabled = (self.allow_empty_submit or (self.selected is not None))
-        submit_font = QFont(self.base_font)
-        submit_font.setBold(True)
-        submit_font.setPointSize(max(22, int(h * 0.038)))
-        p.setFont(submit_font)
-
-        if not enabled:
-            pen = QPen(self.theme.disabled, 3)
-        else:
-            pen = QPen(self.theme.text, 4)
-        pen.setCosmetic(True)
-        p.setPen(pen)
+        p.setFont(self._font_submit)
+        p.setPen(self._pen_submit if enabled else self._pen_submit_disabled)
         p.drawText(submit_rect, Qt.AlignCenter, f"SUBMIT ({sel_txt}) ⏎")
 
         sx, sy = submit_dot
         p.setPen(Qt.NoPen)
         if not enabled:
             p.setBrush(self.theme.disabled)
-            r = max(9, int(h * 0.016))
+            r = r_submit
         else:
             p.setBrush(self.theme.dot)
-            if self._last_submit_score >= self.submit_corr_threshold:
-                r = max(11, int(h * 0.020))
-            else:
-                r = max(9, int(h * 0.016))
+            r = r_submit_hot if self._last_submit_score >= self.submit_corr_threshold else r_submit
         p.drawEllipse(int(sx) - r, int(sy) - r, 2 * r, 2 * r)
 
 